@@ -6,11 +6,16 @@ multi-agent architecture. Each agent is designed to handle specific
 types of tasks and domains.
 """
 
-from .life_manager import LifeManagerAgent
-from .finance import FinanceAgent
-from .data_analyst import DataAnalystAgent
-from .creative import CreativeAgent
-from .instructor import AIInstructorAgent
+from importlib import import_module
+
+# Agents are imported on first access, so loading one doesn't load them all
+_EXPORTS = {
+    'LifeManagerAgent': '.life_manager',
+    'FinanceAgent': '.finance',
+    'DataAnalystAgent': '.data_analyst',
+    'CreativeAgent': '.creative',
+    'AIInstructorAgent': '.instructor',
+}
 
 __all__ = [
     'LifeManagerAgent',
@@ -19,3 +24,13 @@ __all__ = [
     'CreativeAgent',
     'AIInstructorAgent'
 ]
+
+
+def __getattr__(name):
+    """Import an exported name from its submodule on first access"""
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        # Cache it so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
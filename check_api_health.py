@@ -164,8 +164,6 @@ async def check_environment():
     """Check environment configuration"""
     print("\n⚙️ Checking Environment Configuration...")
     
-    load_dotenv()
-    
     config_items = [
         ("GEMINI_API_KEY", "Gemini API Key"),
         ("OPENAI_API_KEY", "OpenAI API Key"),
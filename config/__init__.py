@@ -189,4 +189,4 @@ class ConfigManager:
                 self.logger.debug(f"Created directory: {dir_path}")
 
 # Global configuration instance
-config = ConfigManager()
+config = ConfigManager(os.environ.get("NOVA_CONFIG", "config/config.yaml"))
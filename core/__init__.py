@@ -5,11 +5,17 @@ Neural Omnipresent Virtual Assistant
 This module contains the core engine that orchestrates all NOVA's capabilities.
 """
 
-from .brain import NOVABrain
-from .orchestrator import AgentOrchestrator
-from .memory import MemorySystem
-from .personality import PersonalityEngine
-from .security import SecurityCore
+from importlib import import_module
+
+# Exported names and their submodules, imported on first access so that
+# loading one submodule (or just resolving it) doesn't load all of them
+_EXPORTS = {
+    "NOVABrain": ".brain",
+    "AgentOrchestrator": ".orchestrator",
+    "MemorySystem": ".memory",
+    "PersonalityEngine": ".personality",
+    "SecurityCore": ".security",
+}
 
 __version__ = "0.1.0"
 __all__ = [
@@ -19,3 +25,13 @@ __all__ = [
     "PersonalityEngine",
     "SecurityCore"
 ]
+
+
+def __getattr__(name):
+    """Import an exported name from its submodule on first access"""
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        # Cache it so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
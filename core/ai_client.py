@@ -10,12 +10,17 @@ Supports:
 
 import os
 import asyncio
+import copy
+import hashlib
 import logging
-import json
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, AsyncIterator, Union
 from enum import Enum
 import aiohttp
+import orjson
 from datetime import datetime
 
 # Load environment variables
@@ -32,16 +37,117 @@ class AIModelType(Enum):
     LOCAL = "local"
 
 
-@dataclass
 class AIResponse:
-    """Standardized AI response format"""
-    content: str
-    model_used: str
-    tokens_used: Optional[int] = None
-    reasoning: Optional[str] = None
-    confidence: Optional[float] = None
-    error: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    """Standardized AI response format
+    
+    A plain slotted class rather than a dataclass: one is allocated per AI call,
+    and slots drop the per-instance __dict__ (dataclass(slots=True) needs 3.10+).
+    """
+    __slots__ = ("content", "model_used", "tokens_used", "reasoning", "confidence", "error", "metadata")
+    
+    def __init__(self,
+                 content: str,
+                 model_used: str,
+                 tokens_used: Optional[int] = None,
+                 reasoning: Optional[str] = None,
+                 confidence: Optional[float] = None,
+                 error: Optional[str] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        self.content = content
+        self.model_used = model_used
+        self.tokens_used = tokens_used
+        self.reasoning = reasoning
+        self.confidence = confidence
+        self.error = error
+        self.metadata = metadata
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"AIResponse({fields})"
+
+
+# Provider responses are reused for identical requests within this window
+RESPONSE_CACHE_TTL = 300
+RESPONSE_CACHE_SIZE = 1024
+
+# Local fallback replies, in priority order: (rule, pattern, content, model_used, confidence).
+# A rule without a pattern is matched by its own check in _generate_local_fallback_response.
+_LOCAL_RULES = (
+    # Mathematical questions
+    ("math_2_2", r"2\s*\+\s*2|2 plus 2",
+     "2 + 2 = 4. This is basic addition - when you add 2 and 2 together, you get 4.",
+     "local-math", 1.0),
+    ("math_3_3", r"3\s*\+\s*3|3 plus 3",
+     "3 + 3 = 6. This is basic addition - when you add 3 and 3 together, you get 6.",
+     "local-math", 1.0),
+    # Simple math patterns - "what is" plus an operator anywhere in the prompt
+    ("math", None,
+     "I can help with basic math calculations. For complex calculations, I'd need access to AI models. Please ensure your API keys are configured and have sufficient quota.",
+     "local-math", 0.7),
+    # AI/Technology questions
+    ("ai", r"artificial intelligence|\bai\b|machine learning|\bml\b",
+     "Artificial Intelligence (AI) is a field of computer science focused on creating systems that can perform tasks typically requiring human intelligence. This includes learning, reasoning, problem-solving, and understanding language. Machine learning is a subset of AI that enables systems to learn from data without explicit programming. While I'd love to provide a more detailed explanation, I currently don't have access to advanced AI models due to API limitations.",
+     "local-knowledge", 0.8),
+    # Programming questions
+    ("programming", r"python|programming|code|javascript",
+     "I can help with programming questions! However, for detailed code examples and explanations, I need access to AI models. Please check your API configuration and quota. In the meantime, I recommend checking official documentation or programming tutorials for specific questions.",
+     "local-knowledge", 0.7),
+    # Greetings
+    ("greeting", r"hello|\bhi\b|\bhey\b",
+     "Hello! I'm NOVA, your AI assistant. I'm currently running with limited capabilities due to API quota restrictions. I can still help with basic questions and tasks. For enhanced AI responses, please check your API key configuration and quota limits.",
+     "local-greeting", 0.9),
+    # Test questions
+    ("test", r"test",
+     "✅ NOVA is working! I'm currently operating with local fallback responses because the AI APIs have reached their quota limits. To get enhanced AI responses, please check your Gemini or OpenAI API quotas and billing.",
+     "local-test", 0.9),
+    # Help requests
+    ("help", r"help|what can you do",
+     "I'm NOVA, your AI assistant! Currently running with local capabilities due to API limitations. I can help with:\n• Basic math calculations\n• General information about technology\n• System status and testing\n• Basic programming guidance\n\nFor enhanced AI capabilities, please configure API keys with sufficient quota.",
+     "local-help", 0.8),
+)
+
+# All rules folded into one case-insensitive scan. Each alternative is a lookahead,
+# so matches are zero-width and one rule's match can't swallow another's.
+_LOCAL_PATTERN = re.compile(
+    "|".join(f"(?=(?P<{rule}>{pattern}))" for rule, pattern, *_ in _LOCAL_RULES if pattern),
+    re.IGNORECASE | re.DOTALL
+)
+_LOCAL_RESPONSES = {rule: tuple(response) for rule, _, *response in _LOCAL_RULES}
+_LOCAL_PRIORITY = {rule: priority for priority, (rule, *_) in enumerate(_LOCAL_RULES)}
+_MATH_OPERATOR = re.compile(r"[-+*/]")
+
+# Question types in priority order, with the keywords that identify them
+_QUESTION_TYPES = (
+    ("mathematical", ("+", "-", "*", "/", "calculate", "math", "equation", "solve")),
+    ("factual", ("what is", "who is", "when was", "where is", "how many")),
+    ("explanatory", ("how does", "why does", "explain", "describe")),
+    ("creative", ("create", "write", "generate", "design", "imagine")),
+    ("analytical", ("analyze", "compare", "evaluate", "assess")),
+)
+
+# All keywords in one case-insensitive scan, with lookaheads as in _LOCAL_PATTERN
+_QUESTION_PATTERN = re.compile(
+    "|".join(
+        f"(?=(?P<{question_type}>{'|'.join(map(re.escape, keywords))}))"
+        for question_type, keywords in _QUESTION_TYPES
+    ),
+    re.IGNORECASE
+)
+_QUESTION_PRIORITY = {question_type: priority for priority, (question_type, _) in enumerate(_QUESTION_TYPES)}
+
+
+@lru_cache(maxsize=256)
+def _prompt_prefix(system_prompt: Optional[str], context: Optional[str]) -> str:
+    """System/context preamble of a prompt, shared by calls in the same conversation"""
+    parts = []
+    
+    if system_prompt:
+        parts.append(f"System: {system_prompt}")
+    
+    if context:
+        parts.append(f"Context: {context}")
+    
+    return "".join(f"{part}\n\n" for part in parts)
 
 
 class AIClient:
@@ -65,13 +171,41 @@ class AIClient:
         self.openai_endpoint = "https://api.openai.com/v1/chat/completions"
         self.anthropic_endpoint = "https://api.anthropic.com/v1/messages"
         
+        # Per-provider request URL and headers, fixed for the client's lifetime
+        self._gemini_url = f"{self.gemini_endpoint}/{self.gemini_model}:generateContent?key={self.gemini_api_key}"
+        self._gemini_stream_url = f"{self.gemini_endpoint}/{self.gemini_model}:streamGenerateContent?alt=sse&key={self.gemini_api_key}"
+        self._gemini_headers = {
+            "Content-Type": "application/json",
+        }
+        self._openai_headers = {
+            "Authorization": f"Bearer {self.openai_api_key}",
+            "Content-Type": "application/json"
+        }
+        self._anthropic_headers = {
+            "x-api-key": self.anthropic_api_key or "",
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
+        
         # Session for HTTP requests
         self.session = None
+        
+        # Response cache: request digest -> (stored at, AIResponse), least recently used first
+        self._response_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
     
     async def _ensure_session(self):
-        """Ensure aiohttp session is available"""
+        """Ensure the pooled aiohttp session is available"""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            # Keep-alive pool with cached DNS, so calls to the same provider reuse
+            # their TLS connection instead of handshaking every time
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
     
     async def generate_response(self, 
                               prompt: str, 
@@ -83,6 +217,99 @@ class AIClient:
         if not model_type:
             model_type = AIModelType(self.default_model)
         
+        cache_key = hashlib.blake2b(
+            f"{model_type.value}|{prompt}|{context}|{system_prompt}".encode(),
+            digest_size=16
+        ).digest()
+        cached = self._get_cached_response(cache_key)
+        if cached:
+            return cached
+        
+        response = await self._generate_uncached(prompt, model_type, context, system_prompt)
+        
+        # Only keep real provider answers, a failed or local reply should be retried next time
+        if not response.error and not response.model_used.startswith("local"):
+            self._response_cache[cache_key] = (time.monotonic(), copy.copy(response))
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        
+        return response
+    
+    def _get_cached_response(self, cache_key: bytes) -> Optional[AIResponse]:
+        """Copy of a cached response that is still fresh, or None"""
+        entry = self._response_cache.get(cache_key)
+        if not entry:
+            return None
+        
+        stored_at, response = entry
+        if time.monotonic() - stored_at > RESPONSE_CACHE_TTL:
+            del self._response_cache[cache_key]
+            return None
+        
+        self._response_cache.move_to_end(cache_key)
+        return copy.copy(response)
+    
+    def clear_cache(self):
+        """Drop all cached responses"""
+        self._response_cache.clear()
+    
+    async def stream_response(self,
+                              prompt: str,
+                              model_type: Optional[AIModelType] = None,
+                              context: Optional[str] = None,
+                              system_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Generate AI response, yielding text chunks as the provider produces them
+        
+        Gemini and OpenAI are streamed over server-sent events. Other models, or a
+        stream that fails before its first chunk, fall back to a complete response
+        that is yielded in one piece.
+        """
+        if not model_type:
+            model_type = AIModelType(self.default_model)
+        
+        stream = None
+        if model_type == AIModelType.GEMINI and self.gemini_api_key:
+            stream = self._stream_gemini_response(prompt, context, system_prompt)
+        elif model_type == AIModelType.OPENAI and self.openai_api_key:
+            stream = self._stream_openai_response(prompt, context, system_prompt)
+        
+        if stream is None:
+            response = await self.generate_response(prompt, model_type, context, system_prompt)
+            yield response.content
+            return
+        
+        started = False
+        try:
+            async for chunk in stream:
+                started = True
+                yield chunk
+            return
+        except Exception as e:
+            if started:
+                raise
+            self.logger.warning(f"{model_type.value} streaming failed, trying fallback: {e}")
+        
+        response = await self._generate_fallback_response(prompt, context, system_prompt)
+        yield response.content
+    
+    async def _iter_sse_events(self, response: aiohttp.ClientResponse) -> AsyncIterator[Any]:
+        """Decoded JSON payloads of a server-sent events response"""
+        async for line in response.content:
+            if not line.startswith(b"data:"):
+                continue
+            
+            payload = line[5:].strip()
+            if payload == b"[DONE]":
+                break
+            yield orjson.loads(payload)
+    
+    async def _generate_uncached(self,
+                                 prompt: str,
+                                 model_type: AIModelType,
+                                 context: Optional[str] = None,
+                                 system_prompt: Optional[str] = None) -> AIResponse:
+        """Generate a response from the provider, bypassing the response cache"""
         try:
             # Handle fallback/local models directly
             if model_type in [AIModelType.FALLBACK, AIModelType.LOCAL]:
@@ -108,24 +335,16 @@ class AIClient:
                 error=str(e)
             )
     
-    async def _generate_gemini_response(self, 
-                                      prompt: str, 
-                                      context: Optional[str] = None,
-                                      system_prompt: Optional[str] = None) -> AIResponse:
-        """Generate response using Google Gemini"""
-        await self._ensure_session()
-        
+    def _gemini_request(self,
+                        prompt: str,
+                        context: Optional[str] = None,
+                        system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Gemini request body, shared by the complete and streamed calls"""
         # Construct the full prompt
         full_prompt = self._construct_prompt(prompt, context, system_prompt)
         
-        url = f"{self.gemini_endpoint}/{self.gemini_model}:generateContent"
-        
-        headers = {
-            "Content-Type": "application/json",
-        }
-        
         # Gemini request format
-        data = {
+        return {
             "contents": [
                 {
                     "parts": [
@@ -159,14 +378,23 @@ class AIClient:
                 }
             ]
         }
+    
+    async def _generate_gemini_response(self, 
+                                      prompt: str, 
+                                      context: Optional[str] = None,
+                                      system_prompt: Optional[str] = None) -> AIResponse:
+        """Generate response using Google Gemini"""
+        await self._ensure_session()
+        
+        data = self._gemini_request(prompt, context, system_prompt)
         
         try:
-            async with self.session.post(f"{url}?key={self.gemini_api_key}", 
-                                       headers=headers, 
-                                       json=data) as response:
+            async with self.session.post(self._gemini_url, 
+                                       headers=self._gemini_headers, 
+                                       data=orjson.dumps(data)) as response:
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     
                     if "candidates" in result and len(result["candidates"]) > 0:
                         content = result["candidates"][0]["content"]["parts"][0]["text"]
@@ -192,13 +420,11 @@ class AIClient:
             self.logger.error(f"Gemini API call failed: {e}")
             raise
     
-    async def _generate_openai_response(self, 
-                                      prompt: str, 
-                                      context: Optional[str] = None,
-                                      system_prompt: Optional[str] = None) -> AIResponse:
-        """Generate response using OpenAI GPT"""
-        await self._ensure_session()
-        
+    def _openai_request(self,
+                        prompt: str,
+                        context: Optional[str] = None,
+                        system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """OpenAI request body, shared by the complete and streamed calls"""
         messages = []
         
         # Add system prompt
@@ -212,25 +438,29 @@ class AIClient:
         # Add user prompt
         messages.append({"role": "user", "content": prompt})
         
-        headers = {
-            "Authorization": f"Bearer {self.openai_api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
+        return {
             "model": "gpt-4",
             "messages": messages,
             "temperature": 0.7,
             "max_tokens": 2048
         }
+    
+    async def _generate_openai_response(self, 
+                                      prompt: str, 
+                                      context: Optional[str] = None,
+                                      system_prompt: Optional[str] = None) -> AIResponse:
+        """Generate response using OpenAI GPT"""
+        await self._ensure_session()
+        
+        data = self._openai_request(prompt, context, system_prompt)
         
         try:
             async with self.session.post(self.openai_endpoint, 
-                                       headers=headers, 
-                                       json=data) as response:
+                                       headers=self._openai_headers, 
+                                       data=orjson.dumps(data)) as response:
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     content = result["choices"][0]["message"]["content"]
                     tokens_used = result["usage"]["total_tokens"]
                     
@@ -247,6 +477,51 @@ class AIClient:
             self.logger.error(f"OpenAI API call failed: {e}")
             raise
     
+    async def _stream_gemini_response(self,
+                                      prompt: str,
+                                      context: Optional[str] = None,
+                                      system_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream response text from Google Gemini"""
+        await self._ensure_session()
+        
+        data = self._gemini_request(prompt, context, system_prompt)
+        
+        async with self.session.post(self._gemini_stream_url,
+                                     headers=self._gemini_headers,
+                                     data=orjson.dumps(data)) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Gemini API error {response.status}: {error_text}")
+            
+            async for event in self._iter_sse_events(response):
+                for candidate in event.get("candidates", [])[:1]:
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if part.get("text"):
+                            yield part["text"]
+    
+    async def _stream_openai_response(self,
+                                      prompt: str,
+                                      context: Optional[str] = None,
+                                      system_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream response text from OpenAI GPT"""
+        await self._ensure_session()
+        
+        data = self._openai_request(prompt, context, system_prompt)
+        data["stream"] = True
+        
+        async with self.session.post(self.openai_endpoint,
+                                     headers=self._openai_headers,
+                                     data=orjson.dumps(data)) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"OpenAI API error {response.status}: {error_text}")
+            
+            async for event in self._iter_sse_events(response):
+                for choice in event.get("choices", [])[:1]:
+                    content = choice.get("delta", {}).get("content")
+                    if content:
+                        yield content
+    
     async def _generate_anthropic_response(self, 
                                          prompt: str, 
                                          context: Optional[str] = None,
@@ -257,12 +532,6 @@ class AIClient:
         # Construct full prompt for Claude
         full_prompt = self._construct_prompt(prompt, context, system_prompt)
         
-        headers = {
-            "x-api-key": self.anthropic_api_key,
-            "Content-Type": "application/json",
-            "anthropic-version": "2023-06-01"
-        }
-        
         data = {
             "model": "claude-3-sonnet-20240229",
             "max_tokens": 2048,
@@ -276,11 +545,11 @@ class AIClient:
         
         try:
             async with self.session.post(self.anthropic_endpoint, 
-                                       headers=headers, 
-                                       json=data) as response:
+                                       headers=self._anthropic_headers, 
+                                       data=orjson.dumps(data)) as response:
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     content = result["content"][0]["text"]
                     tokens_used = result["usage"]["input_tokens"] + result["usage"]["output_tokens"]
                     
@@ -303,33 +572,40 @@ class AIClient:
                                         system_prompt: Optional[str] = None) -> AIResponse:
         """Generate fallback response when primary models fail"""
         
-        # Try available models in order of preference
+        # Race every configured provider and take the first successful answer,
+        # so one slow or failing API doesn't hold up the others
+        providers = []
         if self.gemini_api_key:
-            try:
-                return await self._generate_gemini_response(prompt, context, system_prompt)
-            except Exception as e:
-                if "429" in str(e):
-                    self.logger.warning("Gemini API quota exceeded, trying fallback")
-                else:
-                    self.logger.warning(f"Gemini API failed: {e}")
-        
+            providers.append(("Gemini", self._generate_gemini_response))
         if self.openai_api_key:
-            try:
-                return await self._generate_openai_response(prompt, context, system_prompt)
-            except Exception as e:
-                if "429" in str(e):
-                    self.logger.warning("OpenAI API quota exceeded, trying fallback")
-                else:
-                    self.logger.warning(f"OpenAI API failed: {e}")
-        
+            providers.append(("OpenAI", self._generate_openai_response))
         if self.anthropic_api_key:
-            try:
-                return await self._generate_anthropic_response(prompt, context, system_prompt)
-            except Exception as e:
-                if "429" in str(e):
-                    self.logger.warning("Anthropic API quota exceeded, using local fallback")
-                else:
-                    self.logger.warning(f"Anthropic API failed: {e}")
+            providers.append(("Anthropic", self._generate_anthropic_response))
+        
+        pending = {
+            asyncio.create_task(generate(prompt, context, system_prompt)): name
+            for name, generate in providers
+        }
+        
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    
+                    if "429" in str(error):
+                        self.logger.warning(f"{name} API quota exceeded, trying fallback")
+                    else:
+                        self.logger.warning(f"{name} API failed: {error}")
+        finally:
+            # Cancel the providers still running once one has answered
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         
         # Enhanced local fallback responses
         return self._generate_local_fallback_response(prompt, context, system_prompt)
@@ -340,69 +616,17 @@ class AIClient:
                                         system_prompt: Optional[str] = None) -> AIResponse:
         """Generate intelligent local responses when APIs are unavailable"""
         
-        prompt_lower = prompt.lower()
-        
-        # Mathematical questions
-        if any(op in prompt_lower for op in ['2+2', '2 + 2', '2 plus 2']):
-            return AIResponse(
-                content="2 + 2 = 4. This is basic addition - when you add 2 and 2 together, you get 4.",
-                model_used="local-math",
-                confidence=1.0
-            )
-        
-        if any(op in prompt_lower for op in ['3+3', '3 + 3', '3 plus 3']):
+        # Highest-priority rule that matched anywhere in the prompt
+        matched = {match.lastgroup for match in _LOCAL_PATTERN.finditer(prompt)}
+        # Two independent linear scans; as one pattern ".*" makes this quadratic
+        if "what is" in prompt.lower() and _MATH_OPERATOR.search(prompt):
+            matched.add("math")
+        if matched:
+            content, model_used, confidence = _LOCAL_RESPONSES[min(matched, key=_LOCAL_PRIORITY.__getitem__)]
             return AIResponse(
-                content="3 + 3 = 6. This is basic addition - when you add 3 and 3 together, you get 6.",
-                model_used="local-math",
-                confidence=1.0
-            )
-        
-        # Simple math patterns
-        if 'what is' in prompt_lower and any(op in prompt for op in ['+', '-', '*', '/']):
-            return AIResponse(
-                content="I can help with basic math calculations. For complex calculations, I'd need access to AI models. Please ensure your API keys are configured and have sufficient quota.",
-                model_used="local-math",
-                confidence=0.7
-            )
-        
-        # AI/Technology questions
-        if any(term in prompt_lower for term in ['artificial intelligence', 'ai', 'machine learning', 'ml']):
-            return AIResponse(
-                content="Artificial Intelligence (AI) is a field of computer science focused on creating systems that can perform tasks typically requiring human intelligence. This includes learning, reasoning, problem-solving, and understanding language. Machine learning is a subset of AI that enables systems to learn from data without explicit programming. While I'd love to provide a more detailed explanation, I currently don't have access to advanced AI models due to API limitations.",
-                model_used="local-knowledge",
-                confidence=0.8
-            )
-        
-        # Programming questions
-        if any(term in prompt_lower for term in ['python', 'programming', 'code', 'javascript']):
-            return AIResponse(
-                content="I can help with programming questions! However, for detailed code examples and explanations, I need access to AI models. Please check your API configuration and quota. In the meantime, I recommend checking official documentation or programming tutorials for specific questions.",
-                model_used="local-knowledge",
-                confidence=0.7
-            )
-        
-        # Greetings
-        if any(greeting in prompt_lower for greeting in ['hello', 'hi', 'hey']):
-            return AIResponse(
-                content="Hello! I'm NOVA, your AI assistant. I'm currently running with limited capabilities due to API quota restrictions. I can still help with basic questions and tasks. For enhanced AI responses, please check your API key configuration and quota limits.",
-                model_used="local-greeting",
-                confidence=0.9
-            )
-        
-        # Test questions
-        if 'test' in prompt_lower:
-            return AIResponse(
-                content="✅ NOVA is working! I'm currently operating with local fallback responses because the AI APIs have reached their quota limits. To get enhanced AI responses, please check your Gemini or OpenAI API quotas and billing.",
-                model_used="local-test",
-                confidence=0.9
-            )
-        
-        # Help requests
-        if any(term in prompt_lower for term in ['help', 'what can you do']):
-            return AIResponse(
-                content="I'm NOVA, your AI assistant! Currently running with local capabilities due to API limitations. I can help with:\n• Basic math calculations\n• General information about technology\n• System status and testing\n• Basic programming guidance\n\nFor enhanced AI capabilities, please configure API keys with sufficient quota.",
-                model_used="local-help",
-                confidence=0.8
+                content=content,
+                model_used=model_used,
+                confidence=confidence
             )
         
         # Default fallback
@@ -418,35 +642,36 @@ class AIClient:
                          context: Optional[str] = None,
                          system_prompt: Optional[str] = None) -> str:
         """Construct a complete prompt with context and system instructions"""
-        
-        parts = []
-        
-        if system_prompt:
-            parts.append(f"System: {system_prompt}")
-        
-        if context:
-            parts.append(f"Context: {context}")
-        
-        parts.append(f"User: {prompt}")
-        
-        return "\n\n".join(parts)
+        return f"{_prompt_prefix(system_prompt, context)}User: {prompt}"
     
     async def close(self):
         """Close the HTTP session"""
         if self.session:
             await self.session.close()
+            self.session = None
 
 
 class EnhancedQuestionAnswering:
     """Enhanced question answering using AI models"""
     
+    # Questions answered at once, to stay under provider rate limits
+    MAX_CONCURRENT_QUESTIONS = 5
+    
     def __init__(self):
         self.ai_client = AIClient()
         self.logger = logging.getLogger("nova.enhanced_qa")
+        # Created on first use so it binds to the running loop on Python 3.9
+        self._semaphore: Optional[asyncio.Semaphore] = None
     
     async def answer_question(self, question: str, context: Optional[str] = None) -> Dict[str, Any]:
         """Answer questions using AI with enhanced capabilities"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUESTIONS)
         
+        async with self._semaphore:
+            return await self._answer_question(question, context)
+    
+    async def _answer_question(self, question: str, context: Optional[str]) -> Dict[str, Any]:
         # Determine question type for better prompting
         question_type = self._classify_question(question)
         
@@ -488,33 +713,17 @@ class EnhancedQuestionAnswering:
                 "error": str(e)
             }
     
+    def classify_batch(self, questions: List[str]) -> List[str]:
+        """Classify several questions, in order"""
+        return [self._classify_question(question) for question in questions]
+    
     def _classify_question(self, question: str) -> str:
         """Classify the type of question for better processing"""
-        question_lower = question.lower()
-        
-        # Mathematical questions
-        if any(op in question_lower for op in ['+', '-', '*', '/', 'calculate', 'math', 'equation', 'solve']):
-            return "mathematical"
-        
-        # Factual questions
-        elif any(word in question_lower for word in ['what is', 'who is', 'when was', 'where is', 'how many']):
-            return "factual"
-        
-        # Explanatory questions
-        elif any(word in question_lower for word in ['how does', 'why does', 'explain', 'describe']):
-            return "explanatory"
-        
-        # Creative questions
-        elif any(word in question_lower for word in ['create', 'write', 'generate', 'design', 'imagine']):
-            return "creative"
-        
-        # Analytical questions
-        elif any(word in question_lower for word in ['analyze', 'compare', 'evaluate', 'assess']):
-            return "analytical"
-        
-        # Default to general
-        else:
+        # Highest-priority type with a keyword anywhere in the question, else general
+        matched = {match.lastgroup for match in _QUESTION_PATTERN.finditer(question)}
+        if not matched:
             return "general"
+        return min(matched, key=_QUESTION_PRIORITY.__getitem__)
     
     def _get_system_prompt(self, question_type: str) -> str:
         """Get appropriate system prompt based on question type"""
@@ -561,3 +770,22 @@ class EnhancedQuestionAnswering:
     async def close(self):
         """Close the AI client"""
         await self.ai_client.close()
+        # The next asyncio.run() gets a fresh semaphore bound to its own loop
+        self._semaphore = None
+
+
+_shared_qa: Optional[EnhancedQuestionAnswering] = None
+
+
+def get_enhanced_qa() -> EnhancedQuestionAnswering:
+    """
+    Process-wide EnhancedQuestionAnswering, created on first use
+    
+    Lets agents and scripts share one AI client, its connection pool and its
+    response cache. close() only releases the HTTP session, which is reopened
+    on the next request, so the instance stays usable after it.
+    """
+    global _shared_qa
+    if _shared_qa is None:
+        _shared_qa = EnhancedQuestionAnswering()
+    return _shared_qa
@@ -7,7 +7,7 @@ from multi-agent orchestration to decision making.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -139,6 +139,16 @@ class NOVABrain:
                 "type": "error"
             }
     
+    async def process_input_stream(self, input_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process user input, yielding the response as it is produced
+        
+        Each yielded dictionary holds the response text produced so far; the last
+        one is the complete response, as returned by process_input. The agent
+        pipeline currently synthesizes whole responses, so it is yielded once.
+        """
+        yield await self.process_input(input_data)
+    
     async def _learn_from_interaction(self, input_data: Dict[str, Any], response: Dict[str, Any]):
         """Learn and adapt from user interactions"""
         try:
@@ -0,0 +1,31 @@
+"""
+Event Loop - shared runner for NOVA's entry points
+
+Kept free of NOVA imports so that main.py, simple_main.py and nova_clean.py
+can use it without loading the brain, the API or the AI stack.
+"""
+
+import asyncio
+import sys
+
+
+def run_event_loop(coro):
+    """
+    Run a coroutine to completion on uvloop when it is installed
+    
+    uvicorn.Server.serve() runs on whatever loop is already running, so the loop
+    has to be chosen here. Falls back to the stock asyncio loop when uvloop is
+    missing (it is not available on Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    
+    if sys.version_info >= (3, 11):
+        # Loop factory instead of a global policy; uvloop.install() is deprecated on 3.12+
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    
+    uvloop.install()
+    return asyncio.run(coro)
@@ -8,6 +8,7 @@ including user preferences, conversation history, and learned patterns.
 import asyncio
 import json
 import sqlite3
+import orjson
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
@@ -20,6 +21,11 @@ except ImportError:
 import logging
 
 
+def _dumps(data: Any) -> str:
+    """Serialize data for storage, via orjson's C encoder"""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 @dataclass
 class Memory:
     """Represents a single memory item"""
@@ -142,7 +148,7 @@ class MemorySystem:
             # Store in vector database for semantic search (if available)
             if self.memory_collection:
                 self.memory_collection.add(
-                    documents=[json.dumps(input_data)],
+                    documents=[_dumps(input_data)],
                     metadatas=[{
                         "type": "interaction",
                         "timestamp": datetime.now().isoformat(),
@@ -160,7 +166,7 @@ class MemorySystem:
                 memory_id,
                 input_data.get("content", ""),
                 datetime.now().isoformat(),
-                json.dumps(input_data.get("context", {}))
+                _dumps(input_data.get("context", {}))
             ))
             self.sql_connection.commit()
             
@@ -189,7 +195,7 @@ class MemorySystem:
             ''', (
                 pattern_id,
                 input_data.get("type", "general"),
-                json.dumps(pattern_data),
+                _dumps(pattern_data),
                 0.5,  # Initial confidence
                 datetime.now().isoformat()
             ))
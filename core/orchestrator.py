@@ -13,19 +13,20 @@ Manages and coordinates multiple specialized agents with:
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Type
+from typing import Dict, List, Optional, Any, Sequence, Type
 from dataclasses import dataclass
 from enum import Enum
 import json
 
 # Import AI client for enhanced responses
 try:
-    from core.ai_client import EnhancedQuestionAnswering, AIClient
+    from core.ai_client import EnhancedQuestionAnswering, AIClient, get_enhanced_qa
     AI_CLIENT_AVAILABLE = True
 except ImportError as e:
     logging.warning(f"AI client not available: {e}")
     EnhancedQuestionAnswering = None
     AIClient = None
+    get_enhanced_qa = None
     AI_CLIENT_AVAILABLE = False
 
 # Import next-generation NOVA capabilities (with graceful fallback)
@@ -96,8 +97,8 @@ class AgentCapability:
     """Describes what an agent can do"""
     name: str
     description: str
-    input_types: List[str]
-    output_types: List[str]
+    input_types: Sequence[str]
+    output_types: Sequence[str]
     complexity_level: str  # basic, intermediate, advanced
     execution_time: str    # fast, medium, slow
 
@@ -150,7 +151,7 @@ class ResearchAgent(BaseAgent):
         # Initialize enhanced AI capabilities
         self.enhanced_qa = None
         if AI_CLIENT_AVAILABLE:
-            self.enhanced_qa = EnhancedQuestionAnswering()
+            self.enhanced_qa = get_enhanced_qa()
             self.logger.info("🧠 Enhanced AI capabilities initialized")
     
     async def execute_task(self, task: Task) -> Dict[str, Any]:
@@ -934,6 +935,12 @@ class AgentOrchestrator:
         for agent in self.agents.values():
             agent.is_active = False
         
+        # Release pooled HTTP connections held by the integration engines
+        if self.universal_api:
+            await self.universal_api.close()
+        if self.integration_orchestrator:
+            await self.integration_orchestrator.close()
+        
         self.logger.info("😴 Agent orchestrator shutdown complete")
     
     # Next-Generation Helper Methods
@@ -10,8 +10,8 @@ import logging
 import hashlib
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Set, Union
+from dataclasses import dataclass, fields
 from enum import Enum
 import subprocess
 import platform
@@ -73,10 +73,19 @@ class SecurityCore:
     NOVA's central security system providing comprehensive protection
     """
     
-    def __init__(self, config: SecurityConfig = None):
-        self.config = config or SecurityConfig()
+    def __init__(self, config: Union[SecurityConfig, Dict[str, Any], None] = None):
         self.logger = logging.getLogger("nova.security")
         
+        # Settings may also come as a plain mapping, e.g. the config file's security
+        # section, which carries keys meant for other components
+        if isinstance(config, dict):
+            known = {f.name for f in fields(SecurityConfig)}
+            ignored = sorted(config.keys() - known)
+            if ignored:
+                self.logger.debug(f"Ignoring unknown security settings: {', '.join(ignored)}")
+            config = SecurityConfig(**{key: value for key, value in config.items() if key in known})
+        self.config = config or SecurityConfig()
+        
         # Security state
         self.threat_level = ThreatLevel.NONE
         self.active_alerts: List[SecurityAlert] = []
@@ -14,10 +14,12 @@ import json
 import yaml
 import aiohttp
 import ast
+import re
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, NamedTuple
 from dataclasses import dataclass
 from pathlib import Path
+from string import Template
 import importlib.util
 import inspect
 
@@ -28,6 +30,160 @@ sys.path.append(str(Path(__file__).parent.parent))
 from core.orchestrator import BaseAgent, AgentType, Task, AgentCapability
 
 
+# Mock OpenAPI specs for well-known services, served without any network probing
+_KNOWN_API_SPECS = {
+    "github": {
+        "openapi": "3.0.0",
+        "info": {"title": "GitHub API", "version": "v3"},
+        "servers": [{"url": "https://api.github.com"}],
+        "paths": {
+            "/user": {
+                "get": {
+                    "summary": "Get authenticated user",
+                    "responses": {"200": {"description": "User object"}}
+                }
+            },
+            "/repos/{owner}/{repo}": {
+                "get": {
+                    "summary": "Get repository",
+                    "parameters": [
+                        {"name": "owner", "in": "path", "required": True},
+                        {"name": "repo", "in": "path", "required": True}
+                    ]
+                }
+            }
+        }
+    },
+    "notion": {
+        "openapi": "3.0.0",
+        "info": {"title": "Notion API", "version": "2022-06-28"},
+        "servers": [{"url": "https://api.notion.com/v1"}],
+        "paths": {
+            "/pages": {
+                "post": {
+                    "summary": "Create page",
+                    "requestBody": {"required": True}
+                }
+            },
+            "/databases/{database_id}/query": {
+                "post": {
+                    "summary": "Query database",
+                    "parameters": [
+                        {"name": "database_id", "in": "path", "required": True}
+                    ]
+                }
+            }
+        }
+    }
+}
+
+
+# Code generation fragments for auto-generated agents, compiled once at import.
+# Each per-endpoint fragment ends with a newline so the rendered blocks can be
+# joined directly into the module template.
+_AGENT_MODULE_TEMPLATE = Template('''"""
+Auto-generated agent for $title
+Generated on: $generated_at
+"""
+
+import asyncio
+import aiohttp
+import logging
+from typing import Dict, List, Optional, Any
+from datetime import datetime
+
+from core.orchestrator import BaseAgent, AgentType, Task, AgentCapability
+
+# Shared by every capability below, generated endpoints declare no typed inputs/outputs
+_NO_INPUTS = ()
+_NO_OUTPUTS = ()
+
+
+class ${class_name}Agent(BaseAgent):
+    """Auto-generated agent for $title"""
+
+    # Request headers shared by every endpoint call
+    _STATIC_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+    # Maps task actions to handler method names
+    _ACTION_DISPATCH = {
+$dispatch    }
+
+    def __init__(self):
+        super().__init__(AgentType.INTEGRATION)
+        self.service_name = "$title"
+        self.base_url = "$base_url"
+        self.session = None
+
+        # Auto-generated capabilities
+        self.capabilities = [
+$capabilities        ]
+
+    async def execute_task(self, task: Task) -> Dict[str, Any]:
+        """Execute API tasks"""
+        try:
+            if not self.session:
+                self.session = aiohttp.ClientSession()
+
+            handler = self._ACTION_DISPATCH.get(task.parameters.get("action"))
+            if handler is None:
+                return {"error": "Unknown action", "status": "failed"}
+
+            return await getattr(self, handler)(task.parameters)
+
+        except Exception as e:
+            return {"error": str(e), "status": "failed"}
+
+$methods''')
+
+_CAPABILITY_FRAGMENT = Template(
+    '            AgentCapability("$capability", "$description", _NO_INPUTS, _NO_OUTPUTS, "intermediate", "medium"),\n'
+)
+
+# Response decoding statements, chosen per endpoint from its declared 2xx content types
+_DECODE_JSON = 'result = await response.json(content_type=None)'
+_DECODE_TEXT = 'result = await response.text()'
+_DECODE_RUNTIME = (
+    'result = await response.json() if response.content_type == "application/json" '
+    'else await response.text()'
+)
+
+_DISPATCH_FRAGMENT = Template('        "$capability": "_$capability",\n')
+
+_METHOD_FRAGMENT = Template('''    async def _$capability(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute $description"""
+        url = self.base_url + "$path"
+
+        # Replace path parameters
+        for key, value in params.items():
+            url = url.replace("{" + key + "}", str(value))
+
+        # Prepare request
+        method = "$method"
+        data = None
+
+        if method in ["POST", "PUT", "PATCH"]:
+            data = params.get("body", {})
+
+        # Make request
+        async with self.session.request(method, url, json=data, headers=self._STATIC_HEADERS) as response:
+            $decode
+            return {
+                "status": "success" if response.status < 400 else "error",
+                "status_code": response.status,
+                "data": result
+            }
+''')
+
+
+class ParamInfo(NamedTuple):
+    """A single path/query/header parameter of an API endpoint"""
+    name: str
+    type: str
+    required: bool
+    description: str
+
+
 @dataclass
 class APIEndpoint:
     """Represents an API endpoint with its capabilities"""
@@ -68,9 +224,33 @@ class UniversalAPIEngine:
         # API documentation cache
         self.api_docs_cache: Dict[str, Dict[str, Any]] = {}
         
+        # Shared HTTP session for spec discovery, created on first use
+        self.session: Optional[aiohttp.ClientSession] = None
+        
         # Code generation templates
         self.agent_template = self._load_agent_template()
         
+        # Natural language command routing. GitHub keywords take precedence over
+        # Notion ones; each named group maps to a (service, action, parameters) entry.
+        self._nl_pattern = re.compile(
+            r"(?=.*github)(?:.*(?P<github_create_repo>create repo|new repository)"
+            r"|.*(?P<github_get_repo>get repo|show repository))"
+            r"|(?!.*github)(?=.*notion).*(?P<notion_create_page>create page|new page)",
+            re.IGNORECASE | re.DOTALL
+        )
+        self._nl_dispatch = {
+            "github_create_repo": ("github", "create_repos", {
+                "body": {"name": "new-repo", "private": False}
+            }),
+            "github_get_repo": ("github", "get_repos", {
+                "owner": "user",
+                "repo": "repo-name"
+            }),
+            "notion_create_page": ("notion", "create_pages", {
+                "body": {"parent": {"database_id": "example"}, "properties": {}}
+            })
+        }
+        
         # Initialize storage
         self.integrations_dir = Path("integrations/auto_generated")
         self.integrations_dir.mkdir(parents=True, exist_ok=True)
@@ -117,13 +297,18 @@ class UniversalAPIEngine:
     
     async def _discover_api_documentation(self, service_identifier: str) -> Optional[Dict[str, Any]]:
         """Discover API documentation for a service"""
-        # Try multiple discovery methods
+        # Try multiple discovery methods, cheapest first
+        
+        # Method 1: Known public API specifications (no network round trips)
+        known_spec = await self._search_public_api_specs(service_identifier)
+        if known_spec:
+            return known_spec
         
-        # Method 1: Direct URL to OpenAPI/Swagger spec
+        # Method 2: Direct URL to OpenAPI/Swagger spec
         if service_identifier.startswith("http"):
             return await self._fetch_openapi_spec(service_identifier)
         
-        # Method 2: Common API doc endpoints
+        # Method 3: Common API doc endpoints
         common_endpoints = [
             f"https://api.{service_identifier}.com/swagger.json",
             f"https://api.{service_identifier}.com/v1/swagger.json",
@@ -140,29 +325,47 @@ class UniversalAPIEngine:
             except:
                 continue
         
-        # Method 3: Search for public API specifications
-        return await self._search_public_api_specs(service_identifier)
+        return None
+    
+    async def _ensure_session(self):
+        """Ensure the pooled aiohttp session is available"""
+        if not self.session:
+            # Keep-alive pool with cached DNS, so repeated probes against the same
+            # hosts skip the resolver and TCP/TLS handshakes
+            connector = aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self.session:
+            await self.session.close()
+            self.session = None
     
     async def _fetch_openapi_spec(self, url: str) -> Optional[Dict[str, Any]]:
         """Fetch OpenAPI specification from URL"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get('content-type', '')
-                        
-                        if 'json' in content_type:
-                            return await response.json()
-                        elif 'yaml' in content_type or 'yml' in content_type:
-                            text = await response.text()
+            await self._ensure_session()
+            async with self.session.get(url, timeout=30) as response:
+                if response.status == 200:
+                    content_type = response.headers.get('content-type', '')
+                    
+                    if 'json' in content_type:
+                        return await response.json()
+                    elif 'yaml' in content_type or 'yml' in content_type:
+                        text = await response.text()
+                        return yaml.safe_load(text)
+                    else:
+                        # Try to parse as JSON first, then YAML
+                        text = await response.text()
+                        try:
+                            return json.loads(text)
+                        except:
                             return yaml.safe_load(text)
-                        else:
-                            # Try to parse as JSON first, then YAML
-                            text = await response.text()
-                            try:
-                                return json.loads(text)
-                            except:
-                                return yaml.safe_load(text)
         except Exception as e:
             self.logger.debug(f"Failed to fetch spec from {url}: {e}")
             return None
@@ -171,54 +374,7 @@ class UniversalAPIEngine:
         """Search for public API specifications"""
         # This would integrate with APIs.io, RapidAPI, or other API directories
         # For now, return a mock response for demo purposes
-        
-        mock_specs = {
-            "github": {
-                "openapi": "3.0.0",
-                "info": {"title": "GitHub API", "version": "v3"},
-                "servers": [{"url": "https://api.github.com"}],
-                "paths": {
-                    "/user": {
-                        "get": {
-                            "summary": "Get authenticated user",
-                            "responses": {"200": {"description": "User object"}}
-                        }
-                    },
-                    "/repos/{owner}/{repo}": {
-                        "get": {
-                            "summary": "Get repository",
-                            "parameters": [
-                                {"name": "owner", "in": "path", "required": True},
-                                {"name": "repo", "in": "path", "required": True}
-                            ]
-                        }
-                    }
-                }
-            },
-            "notion": {
-                "openapi": "3.0.0",
-                "info": {"title": "Notion API", "version": "2022-06-28"},
-                "servers": [{"url": "https://api.notion.com/v1"}],
-                "paths": {
-                    "/pages": {
-                        "post": {
-                            "summary": "Create page",
-                            "requestBody": {"required": True}
-                        }
-                    },
-                    "/databases/{database_id}/query": {
-                        "post": {
-                            "summary": "Query database",
-                            "parameters": [
-                                {"name": "database_id", "in": "path", "required": True}
-                            ]
-                        }
-                    }
-                }
-            }
-        }
-        
-        return mock_specs.get(service_name.lower())
+        return _KNOWN_API_SPECS.get(service_name.lower())
     
     async def _parse_api_specification(self, api_docs: Dict[str, Any]) -> Dict[str, Any]:
         """Parse OpenAPI specification into structured format"""
@@ -272,12 +428,12 @@ class UniversalAPIEngine:
         
         # Extract parameters
         for param in endpoint_spec.get("parameters", []):
-            param_info = {
-                "name": param.get("name"),
-                "type": param.get("schema", {}).get("type", "string"),
-                "required": param.get("required", False),
-                "description": param.get("description", "")
-            }
+            param_info = ParamInfo(
+                param.get("name"),
+                param.get("schema", {}).get("type", "string"),
+                param.get("required", False),
+                param.get("description", "")
+            )
             
             param_location = param.get("in", "query")
             if param_location in parameters:
@@ -340,109 +496,48 @@ class UniversalAPIEngine:
     async def _generate_agent_code(self, service_id: str, parsed_spec: Dict[str, Any]) -> str:
         """Generate Python agent code for the service"""
         service_info = parsed_spec["service_info"]
-        endpoints = parsed_spec["endpoints"]
-        
-        # Generate imports and class definition
-        code_parts = [
-            '"""',
-            f'Auto-generated agent for {service_info["title"]}',
-            f'Generated on: {datetime.now().isoformat()}',
-            '"""',
-            '',
-            'import asyncio',
-            'import aiohttp',
-            'import logging',
-            'from typing import Dict, List, Optional, Any',
-            'from datetime import datetime',
-            '',
-            'from core.orchestrator import BaseAgent, AgentType, Task, AgentCapability',
-            '',
-            '',
-            f'class {self._to_class_name(service_id)}Agent(BaseAgent):',
-            f'    """Auto-generated agent for {service_info["title"]}"""',
-            '',
-            '    def __init__(self):',
-            f'        super().__init__(AgentType.INTEGRATION)',
-            f'        self.service_name = "{service_info["title"]}"',
-            f'        self.base_url = "{service_info["base_url"]}"',
-            '        self.session = None',
-            '',
-            '        # Auto-generated capabilities',
-            '        self.capabilities = ['
-        ]
         
-        # Generate capabilities
-        for endpoint in endpoints:
-            capability_name = self._generate_capability_name(endpoint)
-            code_parts.append(f'            AgentCapability("{capability_name}", "{endpoint.description}", '
-                            f'[], [], "intermediate", "medium"),')
-        
-        code_parts.extend([
-            '        ]',
-            '',
-            '    async def execute_task(self, task: Task) -> Dict[str, Any]:',
-            '        """Execute API tasks"""',
-            '        try:',
-            '            if not self.session:',
-            '                self.session = aiohttp.ClientSession()',
-            '',
-            '            action = task.parameters.get("action")',
-            ''
-        ])
-        
-        # Generate action handlers
-        for endpoint in endpoints:
-            capability_name = self._generate_capability_name(endpoint)
-            method_name = f'_{capability_name}'
-            
-            code_parts.extend([
-                f'            if action == "{capability_name}":',
-                f'                return await self.{method_name}(task.parameters)',
-            ])
-        
-        code_parts.extend([
-            '',
-            '            return {"error": "Unknown action", "status": "failed"}',
-            '',
-            '        except Exception as e:',
-            '            return {"error": str(e), "status": "failed"}',
-            ''
-        ])
-        
-        # Generate individual method implementations
-        for endpoint in endpoints:
-            capability_name = self._generate_capability_name(endpoint)
-            method_name = f'_{capability_name}'
-            
-            code_parts.extend([
-                f'    async def {method_name}(self, params: Dict[str, Any]) -> Dict[str, Any]:',
-                f'        """Execute {endpoint.description}"""',
-                f'        url = self.base_url + "{endpoint.url}"',
-                '',
-                '        # Replace path parameters',
-                '        for key, value in params.items():',
-                '            url = url.replace("{" + key + "}", str(value))',
-                '',
-                '        # Prepare request',
-                f'        method = "{endpoint.method}"',
-                '        headers = {"Content-Type": "application/json"}',
-                '        data = None',
-                '',
-                '        if method in ["POST", "PUT", "PATCH"]:',
-                '            data = params.get("body", {})',
-                '',
-                '        # Make request',
-                '        async with self.session.request(method, url, json=data, headers=headers) as response:',
-                '            result = await response.json() if response.content_type == "application/json" else await response.text()',
-                '            return {',
-                '                "status": "success" if response.status < 400 else "error",',
-                '                "status_code": response.status,',
-                '                "data": result',
-                '            }',
-                ''
-            ])
-        
-        return '\n'.join(code_parts)
+        # Single pass over the endpoints, filling all three per-endpoint blocks
+        capabilities, dispatch, methods = [], [], []
+        for endpoint in parsed_spec["endpoints"]:
+            fields = {
+                "capability": self._generate_capability_name(endpoint),
+                "description": endpoint.description,
+                "path": endpoint.url,
+                "method": endpoint.method,
+                "decode": self._select_response_decoder(endpoint)
+            }
+            capabilities.append(_CAPABILITY_FRAGMENT.substitute(fields))
+            dispatch.append(_DISPATCH_FRAGMENT.substitute(fields))
+            methods.append(_METHOD_FRAGMENT.substitute(fields))
+        
+        return _AGENT_MODULE_TEMPLATE.substitute(
+            title=service_info["title"],
+            base_url=service_info["base_url"],
+            class_name=self._to_class_name(service_id),
+            generated_at=datetime.now().isoformat(),
+            capabilities="".join(capabilities),
+            dispatch="".join(dispatch),
+            methods="\n".join(methods)
+        )
+    
+    def _select_response_decoder(self, endpoint: APIEndpoint) -> str:
+        """Pick the response decoding statement from the endpoint's 2xx responses"""
+        content_types = set()
+        for status_code, response in endpoint.response_schema.items():
+            if str(status_code).startswith("2") and isinstance(response, dict):
+                content_types.update(response.get("content", {}))
+        
+        if not content_types:
+            # Nothing declared, decide at request time
+            return _DECODE_RUNTIME
+        
+        json_types = {ct for ct in content_types if "json" in ct}
+        if json_types == content_types:
+            return _DECODE_JSON
+        if not json_types:
+            return _DECODE_TEXT
+        return _DECODE_RUNTIME
     
     def _to_class_name(self, service_id: str) -> str:
         """Convert service ID to valid Python class name"""
@@ -452,6 +547,12 @@ class UniversalAPIEngine:
     
     async def _generate_agent_wrapper(self, integration: ServiceIntegration) -> BaseAgent:
         """Generate and instantiate agent wrapper"""
+        # Compiling the generated module is CPU-bound, keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._compile_module_sync, integration)
+    
+    def _compile_module_sync(self, integration: ServiceIntegration) -> BaseAgent:
+        """Write, import and instantiate the generated agent module (blocking)"""
         # Save the generated code to a file
         agent_file = self.integrations_dir / f"{integration.service_id}_agent.py"
         
@@ -537,28 +638,12 @@ class UniversalAPIEngine:
     async def natural_language_command(self, command: str) -> Dict[str, Any]:
         """Execute natural language commands across integrated services"""
         # This would use NLP to parse commands and route to appropriate services
-        # For now, simple keyword matching
-        
-        command_lower = command.lower()
+        # For now, simple keyword matching in a single regex scan
         
-        # GitHub commands
-        if "github" in command_lower:
-            if "create repo" in command_lower or "new repository" in command_lower:
-                return await self.execute_service_action("github", "create_repos", {
-                    "body": {"name": "new-repo", "private": False}
-                })
-            elif "get repo" in command_lower or "show repository" in command_lower:
-                return await self.execute_service_action("github", "get_repos", {
-                    "owner": "user",
-                    "repo": "repo-name"
-                })
-        
-        # Notion commands  
-        elif "notion" in command_lower:
-            if "create page" in command_lower or "new page" in command_lower:
-                return await self.execute_service_action("notion", "create_pages", {
-                    "body": {"parent": {"database_id": "example"}, "properties": {}}
-                })
+        match = self._nl_pattern.match(command)
+        if match:
+            service_id, action, parameters = self._nl_dispatch[match.lastgroup]
+            return await self.execute_service_action(service_id, action, parameters)
         
         return {
             "error": "Could not understand command or service not integrated",
@@ -578,6 +663,10 @@ class IntegrationOrchestrator:
         self.connected_services: Dict[str, Dict[str, Any]] = {}
         self.service_workflows: List[Dict[str, Any]] = []
     
+    async def close(self):
+        """Release the API engine's network resources"""
+        await self.api_engine.close()
+    
     async def auto_integrate_user_services(self, user_services: List[str]) -> Dict[str, Any]:
         """Automatically integrate with all user's digital services"""
         results = {
@@ -0,0 +1,65 @@
+"""
+On-disk cache for GitHub API responses
+
+Entries live under $XDG_CACHE_HOME/nova/github/<scope> (default
+~/.cache/nova/github/<scope>) as small JSON records of the form
+{"version", "ts", "etag", "payload"} so cached responses survive process
+restarts. The scope is derived from the API token, so responses fetched with
+one token are never served to a client using another.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Optional
+
+# Bump when the cached payload layout changes to invalidate old entries
+CACHE_VERSION = 2
+
+
+def cache_dir() -> Path:
+    """Directory holding cached GitHub responses"""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "nova" / "github"
+
+
+def token_scope(api_token: Optional[str]) -> str:
+    """Cache namespace for an API token, without storing the token itself"""
+    if not api_token:
+        return "anonymous"
+    return hashlib.sha256(api_token.encode("utf-8")).hexdigest()[:32]
+
+
+def cache_path(scope: str, key: str) -> Path:
+    """File path for a cache key such as 'issues:owner/repo' within a token scope"""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return cache_dir() / scope / f"{digest}.json"
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """Read a JSON file, returning None if it is missing or unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path: Path, value: Any):
+    """Atomically write a JSON file, creating private parent directories as needed"""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkdir's mode is masked by the umask and ignored for existing directories
+    os.chmod(path.parent, 0o700)
+    tmp_path = path.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with open(fd, "w", encoding="utf-8") as f:
+        json.dump(value, f)
+    os.replace(tmp_path, path)
+
+
+def clear(scope: Optional[str] = None):
+    """Remove cached GitHub responses for one token scope, or for every scope"""
+    directory = cache_dir() / scope if scope else cache_dir()
+    shutil.rmtree(directory, ignore_errors=True)
@@ -9,7 +9,23 @@ Contains all user interface components for NOVA including:
 - Browser extension
 """
 
-from .api import create_nova_api
-from .cli import NOVACLIInterface
+from importlib import import_module
 
 __all__ = ["create_nova_api", "NOVACLIInterface"]
+
+# Exported name -> submodule; imported on first access, so loading the web API
+# doesn't pull in the CLI's rich stack and vice versa
+_EXPORTS = {
+    "create_nova_api": ".api",
+    "NOVACLIInterface": ".cli"
+}
+
+
+def __getattr__(name):
+    """Import an exported name from its submodule on first access"""
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        # Cache it so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
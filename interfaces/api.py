@@ -4,19 +4,84 @@ NOVA FastAPI Web Interface
 Provides REST API endpoints for web-based interaction with NOVA
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
-from typing import Dict, List, Optional, Any
-import json
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from msgspec import Struct
+import msgspec
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Set
+import orjson
 import asyncio
 import logging
+import time
 from datetime import datetime
+from importlib.util import find_spec
 
 
-class ChatMessage(BaseModel):
+# Landing page served at "/", encoded once at import instead of per request
+_ROOT_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>NOVA - Neural Omnipresent Virtual Assistant</title>
+    <style>
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 40px; background: #0a0a0a; color: #fff; }
+        .container { max-width: 800px; margin: 0 auto; }
+        .header { text-align: center; margin-bottom: 40px; }
+        .logo { font-size: 3em; margin-bottom: 10px; }
+        .subtitle { font-size: 1.2em; color: #888; }
+        .features { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 40px 0; }
+        .feature { background: #1a1a1a; padding: 20px; border-radius: 10px; border: 1px solid #333; }
+        .feature h3 { color: #4CAF50; margin-top: 0; }
+        .api-link { display: inline-block; background: #4CAF50; color: white; padding: 12px 24px; text-decoration: none; border-radius: 6px; margin: 10px 5px; }
+        .api-link:hover { background: #45a049; }
+        .status { background: #1a1a1a; padding: 15px; border-radius: 6px; margin: 20px 0; border-left: 4px solid #4CAF50; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <div class="logo">🧠 NOVA</div>
+            <div class="subtitle">Neural Omnipresent Virtual Assistant</div>
+        </div>
+
+        <div class="status">
+            <strong>Status:</strong> ✅ NOVA is active and ready to assist
+        </div>
+
+        <div class="features">
+            <div class="feature">
+                <h3>🤖 Multi-Agent System</h3>
+                <p>Specialized agents for research, development, cybersecurity, and more</p>
+            </div>
+            <div class="feature">
+                <h3>🔒 Security Core</h3>
+                <p>Real-time threat monitoring and protection</p>
+            </div>
+            <div class="feature">
+                <h3>🧠 Adaptive Learning</h3>
+                <p>Learns from interactions and evolves with you</p>
+            </div>
+            <div class="feature">
+                <h3>🌐 Omnichannel</h3>
+                <p>Access through web, CLI, desktop, and mobile</p>
+            </div>
+        </div>
+
+        <div style="text-align: center;">
+            <a href="/docs" class="api-link">📚 API Documentation</a>
+            <a href="/status" class="api-link">📊 System Status</a>
+            <a href="/health" class="api-link">❤️ Health Check</a>
+        </div>
+    </div>
+</body>
+</html>
+""".encode("utf-8")
+
+
+class ChatMessage(Struct):
     """Chat message model"""
     content: str
     type: str = "text"
@@ -24,7 +89,7 @@ class ChatMessage(BaseModel):
     user_id: Optional[str] = None
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(Struct):
     """Chat response model"""
     response: str
     type: str
@@ -34,43 +99,94 @@ class ChatResponse(BaseModel):
     processing_time: Optional[float] = None
 
 
-class SystemStatus(BaseModel):
-    """System status model"""
-    status: str
-    uptime: str
-    memory_usage: Dict[str, Any]
-    active_agents: List[Dict[str, Any]]
-    security_level: str
-    threat_level: int
+# Static response data, built once at import
+_PERSONALITIES = ("professional", "casual", "hacker", "mentor", "creative", "analyst", "assistant")
+
+_SECURITY_TEMPLATE = {
+    "threat_level": 0,
+    "active_alerts": 0,
+    "last_scan": None,
+    "protection_active": True,
+    "vpn_status": "inactive"
+}
+
+
+# Brain status is shared by /status, /agents and /personality for this many seconds
+_STATUS_TTL = 0.25
+
+
+# Response timestamps are reformatted at most once per resolution window
+_ISO_RESOLUTION = 0.01
+_iso_clock = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, cached at _ISO_RESOLUTION granularity"""
+    now = time.time()
+    if now - _iso_clock[0] >= _ISO_RESOLUTION:
+        _iso_clock[0] = now
+        _iso_clock[1] = datetime.fromtimestamp(now).isoformat()
+    return _iso_clock[1]
+
+
+# msgspec codecs, built once and shared by all requests
+_chat_decoder = msgspec.json.Decoder(ChatMessage)
+_json_encoder = msgspec.json.Encoder()
 
 
 class ConnectionManager:
     """WebSocket connection manager"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.logger = logging.getLogger("nova.api.websocket")
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         self.logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
     
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         self.logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
     
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
+    async def send_personal_message(self, message: bytes, websocket: WebSocket):
+        await websocket.send_bytes(message)
     
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                # Remove dead connections
-                self.active_connections.remove(connection)
+        await self._send_to_all(lambda connection: connection.send_text(message))
+    
+    async def heartbeat(self, interval: float = 30.0):
+        """Periodically ping every client, pruning half-open sockets between broadcasts"""
+        while True:
+            await asyncio.sleep(interval)
+            await self._send_to_all(lambda connection: connection.send_bytes(b'{"ping":1}'))
+    
+    async def _send_to_all(self, send: Callable[[WebSocket], Awaitable[None]]):
+        # Send to every client concurrently, so one slow socket doesn't stall the rest
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(send(connection) for connection in connections),
+            return_exceptions=True
+        )
+        
+        # Remove dead connections
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.active_connections.discard(connection)
+
+
+def uvicorn_options() -> Dict[str, Any]:
+    """Server options for running the NOVA API under uvicorn
+
+    Selects the uvloop event loop and httptools parser when they are installed
+    (uvloop is unavailable on Windows), and disables the per-request access log.
+    """
+    return {
+        "loop": "uvloop" if find_spec("uvloop") else "asyncio",
+        "http": "httptools" if find_spec("httptools") else "h11",
+        "access_log": False
+    }
 
 
 def create_nova_api(nova_brain) -> FastAPI:
@@ -81,7 +197,8 @@ def create_nova_api(nova_brain) -> FastAPI:
         description="Neural Omnipresent Virtual Assistant API",
         version="0.1.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse
     )
     
     # CORS middleware for web clients
@@ -93,73 +210,42 @@ def create_nova_api(nova_brain) -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Compress the landing page and larger JSON payloads (/status, /agents)
+    app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+    
     # WebSocket connection manager
     manager = ConnectionManager()
     
     # Logger
     logger = logging.getLogger("nova.api")
     
+    # Last brain status plus the lookup in flight, so dashboard polls share one call
+    status_cache: Dict[str, Any] = {"ts": 0.0, "value": None, "inflight": None}
+    
+    def store_status(task: asyncio.Future):
+        status_cache["inflight"] = None
+        if not task.cancelled() and task.exception() is None:
+            status_cache["value"] = task.result()
+            status_cache["ts"] = time.monotonic()
+    
+    async def get_status_cached() -> Dict[str, Any]:
+        """nova_brain.get_status(), reused for _STATUS_TTL and coalesced across concurrent callers"""
+        if status_cache["value"] is not None and time.monotonic() - status_cache["ts"] < _STATUS_TTL:
+            return status_cache["value"]
+        
+        inflight = status_cache["inflight"]
+        if inflight is None:
+            inflight = asyncio.ensure_future(nova_brain.get_status())
+            inflight.add_done_callback(store_status)
+            status_cache["inflight"] = inflight
+        
+        # Shielded so one disconnecting client doesn't cancel the lookup for the others
+        return await asyncio.shield(inflight)
+    
     @app.get("/", response_class=HTMLResponse)
     async def root():
         """Root endpoint with simple web interface"""
-        return """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>NOVA - Neural Omnipresent Virtual Assistant</title>
-            <style>
-                body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 40px; background: #0a0a0a; color: #fff; }
-                .container { max-width: 800px; margin: 0 auto; }
-                .header { text-align: center; margin-bottom: 40px; }
-                .logo { font-size: 3em; margin-bottom: 10px; }
-                .subtitle { font-size: 1.2em; color: #888; }
-                .features { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 40px 0; }
-                .feature { background: #1a1a1a; padding: 20px; border-radius: 10px; border: 1px solid #333; }
-                .feature h3 { color: #4CAF50; margin-top: 0; }
-                .api-link { display: inline-block; background: #4CAF50; color: white; padding: 12px 24px; text-decoration: none; border-radius: 6px; margin: 10px 5px; }
-                .api-link:hover { background: #45a049; }
-                .status { background: #1a1a1a; padding: 15px; border-radius: 6px; margin: 20px 0; border-left: 4px solid #4CAF50; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <div class="logo">🧠 NOVA</div>
-                    <div class="subtitle">Neural Omnipresent Virtual Assistant</div>
-                </div>
-                
-                <div class="status">
-                    <strong>Status:</strong> ✅ NOVA is active and ready to assist
-                </div>
-                
-                <div class="features">
-                    <div class="feature">
-                        <h3>🤖 Multi-Agent System</h3>
-                        <p>Specialized agents for research, development, cybersecurity, and more</p>
-                    </div>
-                    <div class="feature">
-                        <h3>🔒 Security Core</h3>
-                        <p>Real-time threat monitoring and protection</p>
-                    </div>
-                    <div class="feature">
-                        <h3>🧠 Adaptive Learning</h3>
-                        <p>Learns from interactions and evolves with you</p>
-                    </div>
-                    <div class="feature">
-                        <h3>🌐 Omnichannel</h3>
-                        <p>Access through web, CLI, desktop, and mobile</p>
-                    </div>
-                </div>
-                
-                <div style="text-align: center;">
-                    <a href="/docs" class="api-link">📚 API Documentation</a>
-                    <a href="/status" class="api-link">📊 System Status</a>
-                    <a href="/health" class="api-link">❤️ Health Check</a>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return HTMLResponse(content=_ROOT_HTML)
     
     @app.get("/health")
     async def health_check():
@@ -168,7 +254,7 @@ def create_nova_api(nova_brain) -> FastAPI:
             status = await nova_brain.get_status()
             return {
                 "status": "healthy" if status["state"] == "active" else "degraded",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "version": "0.1.0",
                 "nova_state": status["state"]
             }
@@ -176,46 +262,53 @@ def create_nova_api(nova_brain) -> FastAPI:
             logger.error(f"Health check failed: {e}")
             raise HTTPException(status_code=503, detail="Service unavailable")
     
-    @app.get("/status", response_model=SystemStatus)
+    @app.get("/status")
     async def get_system_status():
         """Get detailed system status"""
         try:
-            status = await nova_brain.get_status()
+            status = await get_status_cached()
             
-            return SystemStatus(
-                status=status["state"],
-                uptime="0:00:00",  # Would calculate actual uptime
-                memory_usage=status.get("memory_stats", {}),
-                active_agents=status.get("active_agents", []),
-                security_level=status.get("security_level", "unknown"),
-                threat_level=0  # Would get from security system
-            )
+            return {
+                "status": status["state"],
+                "uptime": "0:00:00",  # Would calculate actual uptime
+                "memory_usage": status.get("memory_stats", {}),
+                "active_agents": status.get("active_agents", []),
+                "security_level": status.get("security_level", "unknown"),
+                "threat_level": 0  # Would get from security system
+            }
         except Exception as e:
             logger.error(f"Status check failed: {e}")
             raise HTTPException(status_code=500, detail="Unable to get system status")
     
-    @app.post("/chat", response_model=ChatResponse)
-    async def chat_with_nova(message: ChatMessage):
+    @app.post("/chat")
+    async def chat_with_nova(request: Request):
         """Chat with NOVA"""
+        # Decode and validate the ChatMessage body in a single msgspec pass
+        try:
+            message = _chat_decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
-            # Prepare input for NOVA brain
+            # Prepare input for NOVA brain; the receive time stays a raw epoch float,
+            # nothing downstream formats it
             input_data = {
                 "type": message.type,
                 "content": message.content,
-                "context": message.context or {},
+                "context": message.context if message.context is not None else {},
                 "user_id": message.user_id,
-                "timestamp": start_time.isoformat()
+                "timestamp": time.time()
             }
             
             # Process through NOVA brain
             response = await nova_brain.process_input(input_data)
             
             # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
-            return ChatResponse(
+            chat_response = ChatResponse(
                 response=response.get("response", "I apologize, but I couldn't process your request."),
                 type=response.get("type", "text"),
                 sources=response.get("sources", []),
@@ -223,6 +316,7 @@ def create_nova_api(nova_brain) -> FastAPI:
                 agent_used=response.get("agent_used"),
                 processing_time=processing_time
             )
+            return Response(content=_json_encoder.encode(chat_response), media_type="application/json")
             
         except Exception as e:
             logger.error(f"Chat processing failed: {e}")
@@ -244,7 +338,7 @@ def create_nova_api(nova_brain) -> FastAPI:
                 "status": "executed",
                 "instruction": instruction_text,
                 "result": result,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
             
         except Exception as e:
@@ -255,13 +349,10 @@ def create_nova_api(nova_brain) -> FastAPI:
     async def get_personality():
         """Get current personality settings"""
         try:
-            status = await nova_brain.get_status()
+            status = await get_status_cached()
             return {
                 "current_personality": status.get("personality", "unknown"),
-                "available_personalities": [
-                    "professional", "casual", "hacker", "mentor", 
-                    "creative", "analyst", "assistant"
-                ]
+                "available_personalities": _PERSONALITIES
             }
         except Exception as e:
             logger.error(f"Failed to get personality: {e}")
@@ -280,7 +371,7 @@ def create_nova_api(nova_brain) -> FastAPI:
             return {
                 "status": "updated",
                 "personality": personality,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
             
         except Exception as e:
@@ -291,13 +382,13 @@ def create_nova_api(nova_brain) -> FastAPI:
     async def get_agents():
         """Get information about available agents"""
         try:
-            status = await nova_brain.get_status()
+            status = await get_status_cached()
             agents = status.get("active_agents", [])
             
             return {
                 "agents": agents,
                 "total_agents": len(agents),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         except Exception as e:
             logger.error(f"Failed to get agents: {e}")
@@ -308,13 +399,9 @@ def create_nova_api(nova_brain) -> FastAPI:
         """Get security system status"""
         try:
             # This would get actual security status
-            return {
-                "threat_level": 0,
-                "active_alerts": 0,
-                "last_scan": datetime.now().isoformat(),
-                "protection_active": True,
-                "vpn_status": "inactive"
-            }
+            security_status = _SECURITY_TEMPLATE.copy()
+            security_status["last_scan"] = _now_iso()
+            return security_status
         except Exception as e:
             logger.error(f"Failed to get security status: {e}")
             raise HTTPException(status_code=500, detail="Failed to get security status")
@@ -327,7 +414,7 @@ def create_nova_api(nova_brain) -> FastAPI:
             return {
                 "status": "scan_initiated",
                 "scan_id": f"scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         except Exception as e:
             logger.error(f"Failed to trigger security scan: {e}")
@@ -339,9 +426,11 @@ def create_nova_api(nova_brain) -> FastAPI:
         await manager.connect(websocket)
         try:
             while True:
-                # Receive message from client
-                data = await websocket.receive_text()
-                message_data = json.loads(data)
+                # Receive message from client, accepting binary or text frames
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+                message_data = orjson.loads(message.get("bytes") or message.get("text"))
                 
                 # Process message through NOVA
                 input_data = {
@@ -353,9 +442,9 @@ def create_nova_api(nova_brain) -> FastAPI:
                 
                 response = await nova_brain.process_input(input_data)
                 
-                # Send response back
+                # Send response back as a binary frame, orjson already produced UTF-8 bytes
                 await manager.send_personal_message(
-                    json.dumps(response), 
+                    orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS),
                     websocket
                 )
                 
@@ -365,14 +454,22 @@ def create_nova_api(nova_brain) -> FastAPI:
             logger.error(f"WebSocket error: {e}")
             manager.disconnect(websocket)
     
+    # Background tasks started with the app
+    background_tasks: List[asyncio.Task] = []
+    
     @app.on_event("startup")
     async def startup_event():
         """Application startup event"""
         logger.info("🚀 NOVA API server starting up...")
+        background_tasks.append(asyncio.create_task(manager.heartbeat()))
     
     @app.on_event("shutdown")
     async def shutdown_event():
         """Application shutdown event"""
         logger.info("🔄 NOVA API server shutting down...")
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        background_tasks.clear()
     
     return app
@@ -5,12 +5,16 @@ Command-line interface for interacting with NOVA
 """
 
 import asyncio
+import itertools
 import json
 import sys
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 import logging
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
@@ -18,7 +22,79 @@ from rich.live import Live
 from rich.spinner import Spinner
 from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
-from rich import print as rprint
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.formatted_text import HTML
+    from prompt_toolkit.patch_stdout import patch_stdout
+    PROMPT_TOOLKIT_AVAILABLE = True
+except ImportError:
+    PROMPT_TOOLKIT_AVAILABLE = False
+
+
+# Conversation turns kept in memory for /history
+HISTORY_LIMIT = 1000
+
+# Rows of the /help table
+_COMMANDS_INFO = (
+    ("/help", "Show this help message"),
+    ("/status", "Show NOVA system status"),
+    ("/personality [name]", "Get/set personality mode"),
+    ("/agents", "Show active agents"),
+    ("/security", "Show security status"),
+    ("/scan", "Trigger security scan"),
+    ("/god <instruction>", "Execute god mode instruction"),
+    ("/history", "Show conversation history"),
+    ("/clear", "Clear conversation history"),
+    ("/debug", "Toggle debug mode"),
+    ("/exit or /quit", "Exit NOVA CLI")
+)
+
+
+# Static renderables, built on first use and shared by all CLI instances
+@lru_cache(maxsize=None)
+def _welcome_panel() -> Panel:
+    """Welcome banner shown when the CLI starts"""
+    welcome_text = Text()
+    welcome_text.append("🧠 NOVA", style="bold cyan")
+    welcome_text.append(" - Neural Omnipresent Virtual Assistant\n", style="bold")
+    welcome_text.append("Type 'help' for commands or just chat naturally!", style="italic")
+    
+    return Panel(
+        welcome_text,
+        title="Welcome",
+        border_style="cyan",
+        padding=(1, 2)
+    )
+
+
+@lru_cache(maxsize=None)
+def _help_table() -> Table:
+    """Table listing the CLI commands"""
+    table = Table(title="NOVA CLI Commands")
+    table.add_column("Command", style="cyan", no_wrap=True)
+    table.add_column("Description", style="white")
+    
+    for cmd, desc in _COMMANDS_INFO:
+        table.add_row(cmd, desc)
+    
+    return table
+
+
+@lru_cache(maxsize=None)
+def _security_panel() -> Panel:
+    """Security overview panel"""
+    # This would get actual security status
+    return Panel(
+        "[green]🔒 Security Status: PROTECTED[/green]\n"
+        "• Threat Level: [green]NONE[/green]\n"
+        "• Active Alerts: [green]0[/green]\n"
+        "• Real-time Monitoring: [green]ACTIVE[/green]\n"
+        "• VPN Status: [yellow]INACTIVE[/yellow]\n"
+        "• Last Scan: [cyan]Just now[/cyan]",
+        title="Security Overview",
+        border_style="green"
+    )
 
 
 class NOVACLIInterface:
@@ -26,6 +102,22 @@ class NOVACLIInterface:
     Command-line interface for NOVA
     """
     
+    # Command name -> handler method name
+    _COMMANDS = {
+        "help": "_cmd_help",
+        "status": "_cmd_status",
+        "personality": "_cmd_personality",
+        "agents": "_cmd_agents",
+        "security": "_cmd_security",
+        "scan": "_cmd_scan",
+        "god": "_cmd_god_mode",
+        "history": "_cmd_history",
+        "clear": "_cmd_clear",
+        "debug": "_cmd_debug",
+        "exit": "_cmd_exit",
+        "quit": "_cmd_exit"
+    }
+    
     def __init__(self, nova_brain):
         self.nova_brain = nova_brain
         self.console = Console()
@@ -33,27 +125,27 @@ class NOVACLIInterface:
         self.running = False
         self.commands = self._initialize_commands()
         
+        # Spinner shared by every busy indicator
+        self._spinner = Spinner("dots")
+        
+        # Line-editing prompt read on the event loop, when prompt_toolkit is installed
+        self._session = PromptSession() if PROMPT_TOOLKIT_AVAILABLE else None
+        
         # CLI state
         self.current_personality = "assistant"
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=HISTORY_LIMIT)
+        
+        # Fixed shape of every chat input sent to the brain
+        self._input_template = {
+            "type": "text",
+            "content": None,
+            "context": {"interface": "cli", "timestamp": None}
+        }
         self.debug_mode = False
     
     def _initialize_commands(self) -> Dict[str, callable]:
         """Initialize CLI commands"""
-        return {
-            "help": self._cmd_help,
-            "status": self._cmd_status,
-            "personality": self._cmd_personality,
-            "agents": self._cmd_agents,
-            "security": self._cmd_security,
-            "scan": self._cmd_scan,
-            "god": self._cmd_god_mode,
-            "history": self._cmd_history,
-            "clear": self._cmd_clear,
-            "debug": self._cmd_debug,
-            "exit": self._cmd_exit,
-            "quit": self._cmd_exit
-        }
+        return {name: getattr(self, method) for name, method in self._COMMANDS.items()}
     
     async def start(self):
         """Start the CLI interface"""
@@ -83,28 +175,21 @@ class NOVACLIInterface:
             except Exception as e:
                 self.console.print(f"[red]Error: {e}[/red]")
                 if self.debug_mode:
-                    import traceback
-                    self.console.print(traceback.format_exc())
+                    self.console.print_exception(show_locals=False)
         
         self.running = False
     
     def _display_welcome(self):
         """Display welcome message"""
-        welcome_text = Text()
-        welcome_text.append("🧠 NOVA", style="bold cyan")
-        welcome_text.append(" - Neural Omnipresent Virtual Assistant\n", style="bold")
-        welcome_text.append("Type 'help' for commands or just chat naturally!", style="italic")
-        
-        self.console.print(Panel(
-            welcome_text,
-            title="Welcome",
-            border_style="cyan",
-            padding=(1, 2)
-        ))
+        self.console.print(_welcome_panel())
         self.console.print()
     
     async def _get_user_input(self) -> str:
-        """Get user input with rich prompt"""
+        """Get user input, awaiting stdin on the event loop instead of a worker thread"""
+        if self._session is not None:
+            with patch_stdout():
+                return await self._session.prompt_async(HTML("<ansicyan><b>You</b></ansicyan>: "))
+        
         return await asyncio.to_thread(
             Prompt.ask,
             "[bold cyan]You[/bold cyan]",
@@ -121,39 +206,42 @@ class NOVACLIInterface:
     
     async def _handle_command(self, command_input: str):
         """Handle CLI commands"""
-        parts = command_input.split()
-        command = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
+        command, _, rest = command_input.partition(" ")
+        args = rest.split() if rest else []
         
-        if command in self.commands:
-            await self.commands[command](args)
-        else:
+        # Command keys are lowercase; only fold case when the exact lookup misses
+        handler = self.commands.get(command) or self.commands.get(command.lower())
+        if handler is None:
             self.console.print(f"[red]Unknown command: {command}[/red]")
             self.console.print("Type '/help' for available commands")
+            return
+        
+        await handler(args)
     
     async def _handle_chat(self, user_input: str):
         """Handle chat input"""
         try:
-            # Show thinking indicator
-            with Live(Spinner("dots", text="🤔 NOVA is thinking..."), refresh_per_second=10):
-                # Prepare input for NOVA
-                input_data = {
-                    "type": "text",
-                    "content": user_input,
-                    "context": {
-                        "interface": "cli",
-                        "timestamp": datetime.now().isoformat()
-                    }
-                }
-                
-                # Process through NOVA brain
-                response = await self.nova_brain.process_input(input_data)
+            # One timestamp for both the brain input and the history entry
+            timestamp = datetime.now().isoformat()
+            
+            # Prepare input for NOVA; the brain keeps a reference, so the context is a fresh dict
+            input_data = self._input_template.copy()
+            input_data["content"] = user_input
+            input_data["context"] = {**self._input_template["context"], "timestamp": timestamp}
+            
+            # Show thinking indicator until the first output, then render the response as it streams in
+            response = {}
+            with self._busy("🤔 NOVA is thinking...", transient=True) as live:
+                async for response in self.nova_brain.process_input_stream(input_data):
+                    live.update(self._response_panel(response.get("response", "")))
             
-            # Store in conversation history
+            # Store in conversation history, with the /history preview truncated once here
+            response_text = response.get("response", "")
             self.conversation_history.append({
                 "user": user_input,
-                "nova": response.get("response", ""),
-                "timestamp": datetime.now().isoformat()
+                "nova": response_text,
+                "nova_preview": response_text[:100] + "..." if len(response_text) > 100 else response_text,
+                "timestamp": timestamp
             })
             
             # Display response
@@ -167,62 +255,51 @@ class NOVACLIInterface:
         # Main response
         response_text = response.get("response", "I couldn't process your request.")
         
-        self.console.print()
-        self.console.print(Panel(
-            Markdown(response_text),
-            title="[bold green]NOVA[/bold green]",
-            border_style="green",
-            padding=(1, 2)
-        ))
+        # Collected into one Group so the whole response goes out in a single print
+        parts = ["", self._response_panel(response_text)]
         
         # Additional information
         if response.get("sources"):
-            self.console.print("\n[dim]📚 Sources:[/dim]")
-            for source in response["sources"]:
-                self.console.print(f"  • {source}")
+            parts.append("\n[dim]📚 Sources:[/dim]")
+            parts.extend(f"  • {source}" for source in response["sources"])
         
         if response.get("actions_taken"):
-            self.console.print("\n[dim]⚡ Actions taken:[/dim]")
-            for action in response["actions_taken"]:
-                self.console.print(f"  • {action}")
+            parts.append("\n[dim]⚡ Actions taken:[/dim]")
+            parts.extend(f"  • {action}" for action in response["actions_taken"])
         
         if response.get("agents_used"):
-            self.console.print(f"\n[dim]🤖 Agents used: {response['agents_used']}[/dim]")
+            parts.append(f"\n[dim]🤖 Agents used: {response['agents_used']}[/dim]")
         
-        self.console.print()
+        parts.append("")
+        self.console.print(Group(*parts))
+    
+    @contextmanager
+    def _busy(self, text: str, transient: bool = False):
+        """Show the shared spinner with the given text while the block runs"""
+        self._spinner.update(text=text)
+        with Live(self._spinner, console=self.console, refresh_per_second=10, transient=transient) as live:
+            yield live
+    
+    def _response_panel(self, response_text: str) -> Panel:
+        """Panel showing a (possibly partial) NOVA response"""
+        return Panel(
+            Markdown(response_text),
+            title="[bold green]NOVA[/bold green]",
+            border_style="green",
+            padding=(1, 2)
+        )
     
     # Command implementations
     
     async def _cmd_help(self, args: List[str]):
         """Show help information"""
-        table = Table(title="NOVA CLI Commands")
-        table.add_column("Command", style="cyan", no_wrap=True)
-        table.add_column("Description", style="white")
-        
-        commands_info = [
-            ("/help", "Show this help message"),
-            ("/status", "Show NOVA system status"),
-            ("/personality [name]", "Get/set personality mode"),
-            ("/agents", "Show active agents"),
-            ("/security", "Show security status"),
-            ("/scan", "Trigger security scan"),
-            ("/god <instruction>", "Execute god mode instruction"),
-            ("/history", "Show conversation history"),
-            ("/clear", "Clear conversation history"),
-            ("/debug", "Toggle debug mode"),
-            ("/exit or /quit", "Exit NOVA CLI")
-        ]
-        
-        for cmd, desc in commands_info:
-            table.add_row(cmd, desc)
-        
-        self.console.print(table)
+        self.console.print(_help_table())
         self.console.print("\n[dim]💡 Tip: You can also just chat naturally without commands![/dim]")
     
     async def _cmd_status(self, args: List[str]):
         """Show system status"""
         try:
-            with Live(Spinner("dots", text="Getting status..."), refresh_per_second=10):
+            with self._busy("Getting status..."):
                 status = await self.nova_brain.get_status()
             
             # Create status table
@@ -274,7 +351,7 @@ class NOVACLIInterface:
     async def _cmd_agents(self, args: List[str]):
         """Show active agents"""
         try:
-            with Live(Spinner("dots", text="Getting agent info..."), refresh_per_second=10):
+            with self._busy("Getting agent info..."):
                 status = await self.nova_brain.get_status()
             
             agents = status.get("active_agents", [])
@@ -305,17 +382,7 @@ class NOVACLIInterface:
     async def _cmd_security(self, args: List[str]):
         """Show security status"""
         try:
-            # This would get actual security status
-            self.console.print(Panel(
-                "[green]🔒 Security Status: PROTECTED[/green]\n"
-                "• Threat Level: [green]NONE[/green]\n"
-                "• Active Alerts: [green]0[/green]\n"
-                "• Real-time Monitoring: [green]ACTIVE[/green]\n"
-                "• VPN Status: [yellow]INACTIVE[/yellow]\n"
-                "• Last Scan: [cyan]Just now[/cyan]",
-                title="Security Overview",
-                border_style="green"
-            ))
+            self.console.print(_security_panel())
             
         except Exception as e:
             self.console.print(f"[red]Failed to get security status: {e}[/red]")
@@ -325,7 +392,7 @@ class NOVACLIInterface:
         try:
             self.console.print("🔍 Initiating security scan...")
             
-            with Live(Spinner("dots", text="Scanning system..."), refresh_per_second=10):
+            with self._busy("Scanning system..."):
                 # Simulate scan
                 await asyncio.sleep(3)
             
@@ -354,7 +421,7 @@ class NOVACLIInterface:
             self.console.print(f"🚀 [bold]GOD MODE ACTIVATED[/bold]")
             self.console.print(f"Instruction: {instruction}")
             
-            with Live(Spinner("dots", text="Executing autonomous tasks..."), refresh_per_second=10):
+            with self._busy("Executing autonomous tasks..."):
                 result = await self.nova_brain.god_mode(instruction)
             
             self.console.print("[green]✅ God mode execution completed![/green]")
@@ -381,13 +448,14 @@ class NOVACLIInterface:
         if args and args[0].isdigit():
             limit = int(args[0])
         
-        recent_history = self.conversation_history[-limit:]
+        start = max(0, len(self.conversation_history) - limit)
+        recent_history = list(itertools.islice(self.conversation_history, start, None))
         
         self.console.print(f"\n[bold]Last {len(recent_history)} conversations:[/bold]\n")
         
         for i, conv in enumerate(recent_history, 1):
             self.console.print(f"[cyan]{i}. You:[/cyan] {conv['user']}")
-            self.console.print(f"[green]   NOVA:[/green] {conv['nova'][:100]}{'...' if len(conv['nova']) > 100 else ''}")
+            self.console.print(f"[green]   NOVA:[/green] {conv['nova_preview']}")
             self.console.print()
     
     async def _cmd_clear(self, args: List[str]):
@@ -5,11 +5,26 @@ NOVA Quick Start Script
 This script tests NOVA and then launches it if everything is working.
 """
 
+import argparse
 import asyncio
 import sys
 import subprocess
 import os
-from pathlib import Path
+import runpy
+from importlib.util import find_spec
+
+# Launcher interface -> (main.py --mode, startup message)
+LAUNCH_MODES = {
+    "cli": ("cli", "💻 Starting NOVA CLI..."),
+    "both": ("web", "🌐 Starting NOVA with web interface..."),
+    "web": ("api", "🌐 Starting NOVA web interface only...")
+}
+
+def ask(prompt, default):
+    """Read an answer from the terminal, using the default when stdin isn't interactive"""
+    if not sys.stdin.isatty():
+        return default
+    return input(prompt).strip().lower() or default
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -22,16 +37,15 @@ def check_python_version():
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        import fastapi
-        import uvicorn
-        import rich
-        print("✅ Core dependencies found")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependencies: {e}")
+    # Only locate the packages; importing them isn't needed just to launch main.py
+    missing = [name for name in ("fastapi", "uvicorn", "rich") if find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}")
         print("Run: pip install -r requirements.txt")
         return False
+    
+    print("✅ Core dependencies found")
+    return True
 
 def run_tests():
     """Run NOVA tests"""
@@ -39,38 +53,38 @@ def run_tests():
     print("=" * 50)
     
     try:
-        # Run the test script
-        result = subprocess.run([sys.executable, "test_nova.py"], 
-                              capture_output=True, text=True)
-        
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        
-        return result.returncode == 0
+        # Run the test script in this interpreter, its output goes straight to the terminal
+        runpy.run_path("test_nova.py", run_name="__main__")
+        return True
+    except SystemExit as e:
+        return e.code in (0, None)
     except Exception as e:
         print(f"❌ Test execution failed: {e}")
         return False
 
-def launch_nova():
+def launch_nova(interface=None):
     """Launch NOVA"""
     print("\n🚀 Launching NOVA...")
     print("=" * 50)
     
     try:
-        # Check if we want CLI or web interface
-        mode = input("\nChoose interface:\n1. CLI (default)\n2. Web + CLI\n3. Web only\nChoice (1-3): ").strip()
+        # Check if we want CLI or web interface, unless it was given on the command line
+        if interface not in LAUNCH_MODES:
+            choice = ask("\nChoose interface:\n1. CLI (default)\n2. Web + CLI\n3. Web only\nChoice (1-3): ", "1")
+            interface = {"2": "both", "3": "web"}.get(choice, "cli")
+        
+        mode, message = LAUNCH_MODES[interface]
+        print(message)
+        command = [sys.executable, "main.py", f"--mode={mode}"]
         
-        if mode == "2":
-            print("🌐 Starting NOVA with web interface...")
-            subprocess.run([sys.executable, "main.py"])
-        elif mode == "3":
-            print("🌐 Starting NOVA web interface only...")
-            subprocess.run([sys.executable, "main.py"])
+        if os.name == "posix":
+            # Replace the launcher process with NOVA instead of waiting on a child
+            sys.stdout.flush()
+            os.execv(sys.executable, command)
         else:
-            print("💻 Starting NOVA CLI...")
-            subprocess.run([sys.executable, "main.py"])
-            
+            # exec on Windows spawns a detached process, keep the launcher as parent there
+            subprocess.run(command)
+        
     except KeyboardInterrupt:
         print("\n👋 NOVA startup cancelled")
     except Exception as e:
@@ -99,8 +113,34 @@ def show_welcome():
     """
     print(welcome)
 
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="NOVA Quick Start")
+    
+    parser.add_argument(
+        "--mode",
+        choices=list(LAUNCH_MODES),
+        default=os.environ.get("NOVA_LAUNCH_MODE"),
+        help="Interface to launch: cli, both (web + CLI) or web (default: ask, or $NOVA_LAUNCH_MODE)"
+    )
+    
+    tests = parser.add_mutually_exclusive_group()
+    tests.add_argument(
+        "--run-tests",
+        action="store_true",
+        help="Run tests before launching without asking"
+    )
+    tests.add_argument(
+        "--skip-tests",
+        action="store_true",
+        help="Launch without running tests"
+    )
+    
+    return parser.parse_args()
+
 def main():
     """Main launcher function"""
+    args = parse_arguments()
     show_welcome()
     
     # Pre-flight checks
@@ -114,23 +154,30 @@ def main():
         print("   pip install -r requirements.txt")
         sys.exit(1)
     
-    # Create necessary directories
-    Path("data").mkdir(exist_ok=True)
-    Path("logs").mkdir(exist_ok=True)
-    Path("cache").mkdir(exist_ok=True)
+    # Create necessary directories, reading the working directory once and only creating what's missing
+    with os.scandir(".") as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+    for directory in ("data", "logs", "cache"):
+        if directory not in existing:
+            os.mkdir(directory)
     
-    # Ask if user wants to run tests
-    run_test = input("\n🧪 Run tests before launching? (y/N): ").strip().lower()
+    # Ask if user wants to run tests, unless a flag already decided
+    if args.run_tests:
+        run_test = "y"
+    elif args.skip_tests:
+        run_test = "n"
+    else:
+        run_test = ask("\n🧪 Run tests before launching? (y/N): ", "n")
     
     if run_test in ['y', 'yes']:
         if not run_tests():
             print("\n❌ Tests failed. Please check the errors above.")
-            choice = input("Continue anyway? (y/N): ").strip().lower()
+            choice = ask("Continue anyway? (y/N): ", "n")
             if choice not in ['y', 'yes']:
                 sys.exit(1)
     
     # Launch NOVA
-    launch_nova()
+    launch_nova(args.mode)
 
 if __name__ == "__main__":
     try:
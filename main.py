@@ -11,44 +11,68 @@ Multi-mode deployment supporting:
 """
 
 import asyncio
-import argparse
+import json
+import os
 import sys
 import logging
+import logging.handlers
+import queue
 import signal
-import uvicorn
 from pathlib import Path
-from typing import Optional
-
-# Add project root to path
-sys.path.append(str(Path(__file__).parent))
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from config import config
-from core.brain import NOVABrain, NOVAConfig
-from core.security import SecurityCore, SecurityConfig
-from interfaces.api import create_nova_api
-from interfaces.cli import NOVACLIInterface
+from core.event_loop import run_event_loop
+
+# The brain, security, API and server stacks are imported where they're used,
+# so --help and argument errors don't load them
+if TYPE_CHECKING:
+    from core.brain import NOVAConfig
+
+
+def server_settings() -> dict:
+    """uvicorn settings for the API server, each read from config once"""
+    from interfaces.api import uvicorn_options
+    
+    return {
+        **uvicorn_options(),
+        "host": config.get('api.host', 'localhost'),
+        "port": config.get('api.port', 8000),
+        "log_level": config.get('logging.level', 'info').lower(),
+        "access_log": config.get('logging.access_log', False),
+        # Don't let long-lived connections hold shutdown (and brain cleanup) hostage
+        "timeout_graceful_shutdown": config.get('api.graceful_shutdown_timeout', 30),
+        "server_header": False,
+        "date_header": False
+    }
+
+
+def nova_config() -> "NOVAConfig":
+    """Build the NOVA configuration from the config manager"""
+    from core.brain import NOVAConfig
+    
+    return NOVAConfig(
+        name=config.get('nova.name', 'NOVA'),
+        personality=config.get('nova.personality', 'assistant'),
+        voice_enabled=config.get('capabilities.voice_enabled', True),
+        vision_enabled=config.get('capabilities.vision_enabled', True),
+        security_level=config.get('security.security_level', 'high'),
+        debug_mode=config.get('nova.debug_mode', False)
+    )
 
 
 class NOVAMain:
     """Main NOVA application coordinator with multi-mode support"""
     
     def __init__(self, mode: str = "cli"):
-        # Setup logging from configuration
+        # Setup console logging from configuration; the log file and data
+        # directories are only touched once NOVA actually initializes
         self._setup_logging()
         self.logger = logging.getLogger("nova.main")
         
-        # Create necessary directories
-        config.create_dirs()
-        
         # Initialize NOVA configuration from config manager
-        self.config = NOVAConfig(
-            name=config.get('nova.name', 'NOVA'),
-            personality=config.get('nova.personality', 'assistant'),
-            voice_enabled=config.get('capabilities.voice_enabled', True),
-            vision_enabled=config.get('capabilities.vision_enabled', True),
-            security_level=config.get('security.security_level', 'high'),
-            debug_mode=config.get('nova.debug_mode', False)
-        )
+        self.config = nova_config()
         
         self.mode = mode
         
@@ -63,9 +87,6 @@ class NOVAMain:
         # Runtime state
         self.running = False
         self.shutdown_event = asyncio.Event()
-        
-        # Setup signal handlers
-        self._setup_signal_handlers()
     
     def _setup_logging(self):
         """Setup application logging from configuration"""
@@ -73,35 +94,68 @@ class NOVAMain:
         log_format = config.get('logging.format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         
         handlers = []
+        self._log_listener = None
         
         if config.get('logging.console_enabled', True):
             handlers.append(logging.StreamHandler(sys.stdout))
         
-        if config.get('logging.file_enabled', True):
-            log_file = Path(config.get('storage.logs_dir', './logs')) / 'nova.log'
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            handlers.append(logging.FileHandler(log_file))
-        
         logging.basicConfig(
             level=log_level,
             format=log_format,
             handlers=handlers
         )
     
+    def _setup_file_logging(self):
+        """Start writing the log file, if enabled in configuration"""
+        if self._log_listener or not config.get('logging.file_enabled', True):
+            return
+        
+        log_file = Path(config.get('storage.logs_dir', './logs')) / 'nova.log'
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Log calls only enqueue the record; a listener thread does the file writes
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter(
+            config.get('logging.format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        ))
+        logging.getLogger().addHandler(queue_handler)
+        
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue,
+            logging.FileHandler(log_file),
+            respect_handler_level=True
+        )
+        self._log_listener.start()
+    
     def _setup_signal_handlers(self):
-        """Setup graceful shutdown signal handlers"""
-        def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, initiating shutdown...")
-            self.shutdown_event.set()
+        """Setup graceful shutdown signal handlers on the running event loop"""
+        loop = asyncio.get_running_loop()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._request_shutdown, signum)
+            except NotImplementedError:
+                # Windows loops have no add_signal_handler; hop from the handler onto the loop
+                signal.signal(signum, lambda signum, frame: loop.call_soon_threadsafe(self._request_shutdown, signum))
+    
+    def _request_shutdown(self, signum: int):
+        """Signal callback, runs on the event loop"""
+        self.logger.info(f"Received signal {signum}, initiating shutdown...")
+        self.shutdown_event.set()
     
     async def initialize(self) -> bool:
         """Initialize all NOVA components"""
         try:
+            # Create necessary directories and start the log file
+            config.create_dirs()
+            self._setup_file_logging()
+            
             self.logger.info("Initializing NOVA...")
             
+            from core.brain import NOVABrain
+            from core.security import SecurityCore, SecurityConfig
+            
             # Initialize security core first
             security_config = SecurityConfig(
                 real_time_monitoring=config.get('security.real_time_monitoring', True),
@@ -117,10 +171,13 @@ class NOVAMain:
             
             # Initialize interfaces based on mode
             if self.mode in ["api", "web", "daemon"]:
-                self.api = create_nova_api(self.brain, self.config)
+                from interfaces.api import create_nova_api
+                self.api = create_nova_api(self.brain)
                 self.logger.info("API interface initialized")
             
             if self.mode in ["cli", "web"]:
+                # Imported here so api/daemon modes never load the CLI's rich stack
+                from interfaces.cli import NOVACLIInterface
                 self.cli = NOVACLIInterface(self.brain)
                 self.logger.info("CLI interface initialized")
             
@@ -133,6 +190,8 @@ class NOVAMain:
     
     async def run(self) -> bool:
         """Run NOVA in the specified mode"""
+        self._setup_signal_handlers()
+        
         if not await self.initialize():
             return False
         
@@ -165,19 +224,18 @@ class NOVAMain:
         self.logger.info("Starting CLI interface...")
         await self.cli.start()
     
+    def _create_server(self, **options):
+        """Build the uvicorn server for the API app"""
+        import uvicorn
+        
+        settings = server_settings()
+        self.logger.info(f"Starting API server on {settings['host']}:{settings['port']}")
+        
+        return uvicorn.Server(uvicorn.Config(app=self.api, **settings, **options))
+    
     async def _run_api_mode(self):
         """Run in API-only mode"""
-        self.logger.info(f"Starting API server on {config.get('api.host')}:{config.get('api.port')}")
-        
-        uvicorn_config = uvicorn.Config(
-            app=self.api,
-            host=config.get('api.host', 'localhost'),
-            port=config.get('api.port', 8000),
-            log_level=config.get('logging.level', 'info').lower(),
-            reload=config.get('nova.debug_mode', False)
-        )
-        
-        server = uvicorn.Server(uvicorn_config)
+        server = self._create_server(reload=config.get('nova.debug_mode', False))
         await server.serve()
     
     async def _run_web_mode(self):
@@ -185,45 +243,46 @@ class NOVAMain:
         self.logger.info("Starting web interface with CLI support...")
         
         # Start API server in background
-        uvicorn_config = uvicorn.Config(
-            app=self.api,
-            host=config.get('api.host', 'localhost'),
-            port=config.get('api.port', 8000),
-            log_level=config.get('logging.level', 'info').lower()
-        )
-        
-        server = uvicorn.Server(uvicorn_config)
+        server = self._create_server()
         
         # Run server and CLI concurrently
-        await asyncio.gather(
-            server.serve(),
-            self.cli.start(),
-            self._wait_for_shutdown()
-        )
+        await self._serve_until_shutdown(server, self.cli.start())
     
     async def _run_daemon_mode(self):
         """Run in background daemon mode"""
         self.logger.info("Starting daemon mode...")
         
         # Start API server
-        uvicorn_config = uvicorn.Config(
-            app=self.api,
-            host=config.get('api.host', 'localhost'),
-            port=config.get('api.port', 8000),
-            log_level=config.get('logging.level', 'info').lower()
-        )
-        
-        server = uvicorn.Server(uvicorn_config)
+        server = self._create_server()
         
         # Run until shutdown signal
-        await asyncio.gather(
-            server.serve(),
-            self._wait_for_shutdown()
-        )
+        await self._serve_until_shutdown(server)
     
-    async def _wait_for_shutdown(self):
-        """Wait for shutdown signal"""
-        await self.shutdown_event.wait()
+    async def _serve_until_shutdown(self, server, *companions):
+        """
+        Run the API server and companion coroutines until shutdown
+        
+        Returns once a shutdown is requested or any of them finishes, after
+        asking the server to exit and cancelling whatever is still running.
+        The first error raised by the server or a companion is re-raised.
+        """
+        server_task = asyncio.create_task(server.serve())
+        tasks = [server_task, *(asyncio.create_task(companion) for companion in companions)]
+        shutdown_task = asyncio.create_task(self.shutdown_event.wait())
+        
+        try:
+            done, _ = await asyncio.wait([shutdown_task, *tasks], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Let uvicorn drain connections itself, cancel everything else
+            server.should_exit = True
+            for task in tasks[1:]:
+                task.cancel()
+            shutdown_task.cancel()
+            await asyncio.gather(*tasks, shutdown_task, return_exceptions=True)
+        
+        for task in done:
+            if task is not shutdown_task and not task.cancelled() and task.exception():
+                raise task.exception()
     
     async def shutdown(self):
         """Gracefully shutdown NOVA"""
@@ -238,10 +297,31 @@ class NOVAMain:
             await self.security.cleanup()
         
         self.logger.info("NOVA shutdown complete. Goodbye!")
+        
+        # Flush queued log records to the file and stop the writer thread
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
 
 
 def parse_arguments():
     """Parse command line arguments"""
+    # Plain `python main.py` is the common launch; skip building the parser
+    # (and importing argparse) when there is nothing to parse
+    if len(sys.argv) == 1:
+        return SimpleNamespace(
+            mode="cli",
+            personality="assistant",
+            debug=False,
+            config=None,
+            god_mode=None,
+            host=None,
+            port=None,
+            workers=None
+        )
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="NOVA - Neural Omnipresent Virtual Assistant",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -302,9 +382,57 @@ Examples:
         help="API server port (overrides config)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="API worker processes for api/daemon modes (overrides config, default: 1)"
+    )
+    
     return parser.parse_args()
 
 
+def create_worker_app():
+    """
+    Build the API app inside a uvicorn worker process
+    
+    Each worker owns its own brain, initialized and shut down with the app.
+    """
+    from core.brain import NOVABrain
+    from interfaces.api import create_nova_api
+    
+    # Command line overrides from the supervisor; see serve_workers()
+    for path, value in json.loads(os.environ.get('NOVA_CONFIG_OVERRIDES', '{}')).items():
+        config.set(path, value)
+    
+    brain = NOVABrain(nova_config())
+    app = create_nova_api(brain)
+    app.add_event_handler("startup", brain.initialize)
+    app.add_event_handler("shutdown", brain.shutdown)
+    return app
+
+
+def serve_workers(workers: int, overrides: Dict[str, Any]):
+    """
+    Serve the API from several uvicorn worker processes
+    
+    Workers re-import this module and rebuild the configuration themselves from
+    the same config file and environment. Only the config path and command line
+    overrides are handed over, through environment variables, so settings
+    loaded from the environment (API keys included) never reach the disk.
+    """
+    import uvicorn
+    
+    os.environ['NOVA_CONFIG'] = str(config.config_path)
+    os.environ['NOVA_CONFIG_OVERRIDES'] = json.dumps(overrides)
+    
+    uvicorn.run(
+        "main:create_worker_app",
+        factory=True,
+        workers=workers,
+        **server_settings()
+    )
+
+
 async def execute_god_mode(instruction: str) -> bool:
     """Execute a God Mode instruction and exit"""
     try:
@@ -328,24 +456,35 @@ async def main():
     """Main entry point with next-generation capabilities"""
     args = parse_arguments()
     
+    if args.config:
+        # Reload config from specified file, before the overrides below
+        config.config_path = Path(args.config)
+        config.reload()
+    
     # Apply CLI argument overrides to config
+    overrides: Dict[str, Any] = {}
     if args.debug:
-        config.set('nova.debug_mode', True)
-        config.set('logging.level', 'DEBUG')
+        overrides['nova.debug_mode'] = True
+        overrides['logging.level'] = 'DEBUG'
     
     if args.personality:
-        config.set('nova.personality', args.personality)
+        overrides['nova.personality'] = args.personality
     
     if args.host:
-        config.set('api.host', args.host)
+        overrides['api.host'] = args.host
     
     if args.port:
-        config.set('api.port', args.port)
+        overrides['api.port'] = args.port
     
-    if args.config:
-        # Reload config from specified file
-        config.config_path = Path(args.config)
-        config.reload()
+    for path, value in overrides.items():
+        config.set(path, value)
+    
+    # Multi-process API serving; the supervisor only manages worker processes,
+    # so blocking the loop here is fine. Web mode shares its loop with the CLI.
+    workers = args.workers or config.get('api.workers', 1)
+    if workers > 1 and args.mode in ["api", "daemon"]:
+        serve_workers(workers, overrides)
+        sys.exit(0)
     
     # Handle God Mode execution
     if args.god_mode:
@@ -386,4 +525,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -18,9 +18,6 @@ import uvicorn
 from pathlib import Path
 from typing import Optional
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent))
-
 from config import config
 from core.brain import NOVABrain, NOVAConfig
 from core.security import SecurityCore, SecurityConfig
@@ -5,13 +5,16 @@ Clean, simple implementation supporting multiple AI providers with intelligent
 fallbacks and professional error handling.
 """
 
+import ast
 import asyncio
-import aiohttp
+import httpx
 import json
 import logging
+import operator
+import re
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Union, AsyncIterator
 from datetime import datetime
 
 from ..core.config import NovaConfig
@@ -26,16 +29,31 @@ class AIProvider(Enum):
     LOCAL = "local"
 
 
-@dataclass
 class AIResponse:
     """Standardized AI response."""
-    content: str
-    provider: str
-    model: str
-    tokens_used: Optional[int] = None
-    confidence: Optional[float] = None
-    metadata: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
+    __slots__ = ("content", "provider", "model", "tokens_used", "confidence", "metadata", "error")
+    
+    def __init__(
+        self,
+        content: str,
+        provider: str,
+        model: str,
+        tokens_used: Optional[int] = None,
+        confidence: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ):
+        self.content = content
+        self.provider = provider
+        self.model = model
+        self.tokens_used = tokens_used
+        self.confidence = confidence
+        self.metadata = metadata
+        self.error = error
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"AIResponse({fields})"
     
     @property
     def success(self) -> bool:
@@ -43,13 +61,67 @@ class AIResponse:
         return self.error is None
 
 
+# Plain arithmetic questions the local provider answers itself, e.g. "what is 3*7?":
+# an optional lead-in, then nothing but an expression. Both patterns are linear;
+# the length cap also bounds the size of the operands and the result.
+_MATH_PREFIX = re.compile(r"\s*(?:what(?:'s| is)|calculate|compute|evaluate)", re.IGNORECASE)
+_MATH_EXPRESSION = re.compile(r"[\d\s()+\-*/.]+")
+_MAX_MATH_LENGTH = 200
+
+_MATH_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _eval_math_node(node: ast.AST) -> Union[int, float]:
+    """Evaluate an arithmetic AST node, rejecting anything but numbers and + - * /"""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _MATH_OPERATORS:
+        return _MATH_OPERATORS[type(node.op)](_eval_math_node(node.left), _eval_math_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _MATH_OPERATORS:
+        return _MATH_OPERATORS[type(node.op)](_eval_math_node(node.operand))
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+@lru_cache(maxsize=256)
+def _solve_math(prompt: str) -> Optional[str]:
+    """Answer to a plain arithmetic question, or None if the prompt isn't one."""
+    if len(prompt) > _MAX_MATH_LENGTH:
+        return None
+    
+    prefix = _MATH_PREFIX.match(prompt)
+    expression = prompt[prefix.end():] if prefix else prompt
+    expression = expression.strip().rstrip("?=!").rstrip()
+    if not _MATH_EXPRESSION.fullmatch(expression) or not any(char.isdigit() for char in expression):
+        return None
+    
+    expression = " ".join(expression.split())
+    try:
+        tree = ast.parse(expression, mode="eval")
+        if isinstance(tree.body, ast.Constant):
+            return None
+        result = _eval_math_node(tree.body)
+        
+        if isinstance(result, float) and result.is_integer():
+            result = int(result)
+        return f"{expression} = {result}"
+    except (SyntaxError, ValueError, ZeroDivisionError, OverflowError):
+        return None
+
+
 class AIClient:
     """Professional AI client with multi-provider support."""
     
     def __init__(self, config: NovaConfig):
         self.config = config
         self.logger = get_logger("ai")
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[httpx.AsyncClient] = None
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -63,13 +135,17 @@ class AIClient:
     async def _ensure_session(self):
         """Ensure HTTP session is available."""
         if self.session is None:
-            timeout = aiohttp.ClientTimeout(total=self.config.ai_timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            # HTTP/2 multiplexes concurrent calls to a provider over one TLS connection
+            self.session = httpx.AsyncClient(
+                http2=True,
+                timeout=self.config.ai_timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=32)
+            )
     
     async def close(self):
         """Close HTTP session."""
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
             self.session = None
     
     async def generate_response(
@@ -111,6 +187,45 @@ class AIClient:
         # Try fallback providers
         return await self._generate_fallback(prompt, context, system_prompt)
     
+    async def stream_response(
+        self,
+        prompt: str,
+        provider: Optional[AIProvider] = None,
+        context: Optional[str] = None,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[AIResponse]:
+        """
+        Generate AI response, yielding partial responses as the provider produces them.
+        
+        Each yielded AIResponse carries one chunk of content. Gemini and OpenAI are
+        streamed over server-sent events; other providers, or a stream that fails
+        before its first chunk, fall back to generate_response() in one piece.
+        """
+        if provider is None:
+            provider = self._select_provider()
+        
+        stream = None
+        if provider == AIProvider.GEMINI and self.config.gemini_api_key:
+            stream = self._stream_gemini(prompt, context, system_prompt)
+        elif provider == AIProvider.OPENAI and self.config.openai_api_key:
+            stream = self._stream_openai(prompt, context, system_prompt)
+        
+        if stream is not None:
+            started = False
+            try:
+                async for chunk in stream:
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if started:
+                    raise
+                self.logger.warning(f"Streaming from {provider.value} failed: {e}")
+                yield await self._generate_fallback(prompt, context, system_prompt)
+                return
+        
+        yield await self.generate_response(prompt, provider, context, system_prompt)
+    
     def _select_provider(self) -> AIProvider:
         """Select the best available AI provider."""
         if self.config.default_ai_model == "gemini" and self.config.gemini_api_key:
@@ -131,40 +246,76 @@ class AIClient:
         """Generate response using Google Gemini."""
         await self._ensure_session()
         
-        full_prompt = self._build_prompt(prompt, context, system_prompt)
-        
         url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.config.gemini_model}:generateContent"
         headers = {"Content-Type": "application/json"}
         
-        data = {
-            "contents": [{"parts": [{"text": full_prompt}]}],
+        response = await self.session.post(
+            f"{url}?key={self.config.gemini_api_key}",
+            headers=headers,
+            json=self._gemini_request(prompt, context, system_prompt)
+        )
+        if response.status_code == 200:
+            result = response.json()
+            if "candidates" in result and result["candidates"]:
+                content = result["candidates"][0]["content"]["parts"][0]["text"]
+                tokens = result.get("usageMetadata", {}).get("totalTokenCount", 0)
+                
+                return AIResponse(
+                    content=content,
+                    provider="gemini",
+                    model=self.config.gemini_model,
+                    tokens_used=tokens
+                )
+        
+        raise Exception(f"Gemini API error {response.status_code}: {response.text}")
+    
+    async def _stream_gemini(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[AIResponse]:
+        """Stream a response from Google Gemini."""
+        await self._ensure_session()
+        
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.config.gemini_model}:streamGenerateContent"
+        headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+        
+        async with self.session.stream(
+            "POST",
+            f"{url}?alt=sse&key={self.config.gemini_api_key}",
+            headers=headers,
+            json=self._gemini_request(prompt, context, system_prompt)
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise Exception(f"Gemini API error {response.status_code}: {response.text}")
+            
+            async for event in self._iter_sse_events(response):
+                for candidate in event.get("candidates", ()):
+                    for part in candidate.get("content", {}).get("parts", ()):
+                        if part.get("text"):
+                            yield AIResponse(
+                                content=part["text"],
+                                provider="gemini",
+                                model=self.config.gemini_model
+                            )
+    
+    def _gemini_request(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Gemini request body, shared by the complete and streamed calls."""
+        return {
+            "contents": [{"parts": [{"text": self._build_prompt(prompt, context, system_prompt)}]}],
             "generationConfig": {
                 "temperature": self.config.ai_temperature,
                 "maxOutputTokens": self.config.ai_max_tokens,
                 "candidateCount": 1
             }
         }
-        
-        async with self.session.post(
-            f"{url}?key={self.config.gemini_api_key}",
-            headers=headers,
-            json=data
-        ) as response:
-            if response.status == 200:
-                result = await response.json()
-                if "candidates" in result and result["candidates"]:
-                    content = result["candidates"][0]["content"]["parts"][0]["text"]
-                    tokens = result.get("usageMetadata", {}).get("totalTokenCount", 0)
-                    
-                    return AIResponse(
-                        content=content,
-                        provider="gemini",
-                        model=self.config.gemini_model,
-                        tokens_used=tokens
-                    )
-            
-            error_text = await response.text()
-            raise Exception(f"Gemini API error {response.status}: {error_text}")
     
     async def _generate_openai(
         self,
@@ -175,6 +326,70 @@ class AIClient:
         """Generate response using OpenAI."""
         await self._ensure_session()
         
+        url = "https://api.openai.com/v1/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {self.config.openai_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        data = self._openai_request(prompt, context, system_prompt)
+        
+        response = await self.session.post(url, headers=headers, json=data)
+        if response.status_code == 200:
+            result = response.json()
+            content = result["choices"][0]["message"]["content"]
+            tokens = result["usage"]["total_tokens"]
+            
+            return AIResponse(
+                content=content,
+                provider="openai",
+                model=self.config.openai_model,
+                tokens_used=tokens
+            )
+        
+        raise Exception(f"OpenAI API error {response.status_code}: {response.text}")
+    
+    async def _stream_openai(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[AIResponse]:
+        """Stream a response from OpenAI."""
+        await self._ensure_session()
+        
+        url = "https://api.openai.com/v1/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {self.config.openai_api_key}",
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream"
+        }
+        
+        data = self._openai_request(prompt, context, system_prompt)
+        data["stream"] = True
+        
+        async with self.session.stream("POST", url, headers=headers, json=data) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise Exception(f"OpenAI API error {response.status_code}: {response.text}")
+            
+            async for event in self._iter_sse_events(response):
+                for choice in event.get("choices", ()):
+                    text = choice.get("delta", {}).get("content")
+                    if text:
+                        yield AIResponse(
+                            content=text,
+                            provider="openai",
+                            model=self.config.openai_model
+                        )
+    
+    def _openai_request(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """OpenAI request body, shared by the complete and streamed calls."""
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
@@ -182,34 +397,23 @@ class AIClient:
             messages.append({"role": "system", "content": f"Context: {context}"})
         messages.append({"role": "user", "content": prompt})
         
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.config.openai_api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
+        return {
             "model": self.config.openai_model,
             "messages": messages,
             "temperature": self.config.ai_temperature,
             "max_tokens": self.config.ai_max_tokens
         }
-        
-        async with self.session.post(url, headers=headers, json=data) as response:
-            if response.status == 200:
-                result = await response.json()
-                content = result["choices"][0]["message"]["content"]
-                tokens = result["usage"]["total_tokens"]
-                
-                return AIResponse(
-                    content=content,
-                    provider="openai",
-                    model=self.config.openai_model,
-                    tokens_used=tokens
-                )
+    
+    async def _iter_sse_events(self, response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+        """Decoded JSON payloads of a server-sent events response."""
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
             
-            error_text = await response.text()
-            raise Exception(f"OpenAI API error {response.status}: {error_text}")
+            payload = line[5:].strip()
+            if payload == "[DONE]":
+                break
+            yield json.loads(payload)
     
     async def _generate_anthropic(
         self,
@@ -235,21 +439,20 @@ class AIClient:
             "messages": [{"role": "user", "content": full_prompt}]
         }
         
-        async with self.session.post(url, headers=headers, json=data) as response:
-            if response.status == 200:
-                result = await response.json()
-                content = result["content"][0]["text"]
-                tokens = result["usage"]["input_tokens"] + result["usage"]["output_tokens"]
-                
-                return AIResponse(
-                    content=content,
-                    provider="anthropic",
-                    model=self.config.anthropic_model,
-                    tokens_used=tokens
-                )
+        response = await self.session.post(url, headers=headers, json=data)
+        if response.status_code == 200:
+            result = response.json()
+            content = result["content"][0]["text"]
+            tokens = result["usage"]["input_tokens"] + result["usage"]["output_tokens"]
             
-            error_text = await response.text()
-            raise Exception(f"Anthropic API error {response.status}: {error_text}")
+            return AIResponse(
+                content=content,
+                provider="anthropic",
+                model=self.config.anthropic_model,
+                tokens_used=tokens
+            )
+        
+        raise Exception(f"Anthropic API error {response.status_code}: {response.text}")
     
     def _generate_local(
         self,
@@ -258,6 +461,16 @@ class AIClient:
         system_prompt: Optional[str] = None
     ) -> AIResponse:
         """Generate local fallback response."""
+        # Arithmetic is answered exactly
+        answer = _solve_math(prompt)
+        if answer:
+            return AIResponse(
+                content=answer,
+                provider="local",
+                model="math",
+                confidence=1.0
+            )
+        
         prompt_lower = prompt.lower()
         
         # Math responses
@@ -7,7 +7,9 @@ helpful prompts, and professional formatting.
 
 import asyncio
 import sys
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, List, Dict
 from datetime import datetime
 
 from ..core.assistant import NovaAssistant
@@ -15,6 +17,37 @@ from ..core.logger import get_logger
 from ..ai.client import AIResponse
 
 
+# Special command aliases -> _cmd_<action> handler
+_COMMANDS: Dict[str, str] = {
+    "quit": "quit", "exit": "quit", "q": "quit",
+    "help": "help", "?": "help",
+    "clear": "clear", "cls": "clear",
+    "history": "history", "h": "history",
+    "status": "status", "info": "status",
+    "clear history": "clear_history", "clear_history": "clear_history",
+}
+
+_HELP_TEXT = """
+📖 Available Commands:
+  
+  General:
+  • help, ?           - Show this help message
+  • quit, exit, q     - Exit NOVA
+  • clear, cls        - Clear screen
+  • status, info      - Show system status
+  
+  Conversation:
+  • history, h        - Show conversation history
+  • clear history     - Clear conversation history
+  
+  Examples:
+  • "What is artificial intelligence?"
+  • "Calculate 15 * 24"
+  • "Write a short poem"
+  • "Explain quantum computing"
+        """
+
+
 class CliInterface:
     """Professional command-line interface for NOVA."""
     
@@ -23,6 +56,13 @@ class CliInterface:
         self.logger = get_logger("cli")
         self.running = False
         
+        # One dedicated thread for blocking input(), reused for every prompt
+        self._input_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nova-stdin")
+        
+        # Both only depend on the configuration, so they are formatted once
+        self._prompt = f"\n🤖 {assistant.config.name} > "
+        self._welcome_banner: Optional[str] = None
+        
     async def start(self):
         """Start the interactive CLI."""
         self.running = True
@@ -58,22 +98,22 @@ class CliInterface:
                     
         finally:
             self.running = False
+            await self.close()
+    
+    async def close(self):
+        """Release the input thread."""
+        self._input_executor.shutdown(wait=False)
     
     async def _get_user_input(self) -> str:
         """Get input from user with proper prompt."""
-        try:
-            # Run input in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None, 
-                input, 
-                f"\n🤖 {self.assistant.config.name} > "
-            )
-        except (KeyboardInterrupt, EOFError):
-            raise
-        except Exception as e:
-            self.logger.error(f"Input error: {e}")
-            return ""
+        # Run input on the dedicated input thread to avoid blocking; Ctrl+C and
+        # EOF propagate to start(), which ends the session
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._input_executor,
+            input,
+            self._prompt
+        )
     
     async def _process_user_query(self, query: str):
         """Process user query and display response."""
@@ -92,48 +132,47 @@ class CliInterface:
     
     def _handle_special_commands(self, user_input: str) -> bool:
         """Handle special CLI commands. Returns True if command was handled."""
-        command = user_input.strip().lower()
-        
-        if command in ['quit', 'exit', 'q']:
-            print("👋 Goodbye!")
-            self.running = False
-            return True
-        
-        elif command in ['help', '?']:
-            self._show_help()
-            return True
-        
-        elif command in ['clear', 'cls']:
-            self._clear_screen()
-            return True
-        
-        elif command in ['history', 'h']:
-            self._show_history()
-            return True
-        
-        elif command in ['status', 'info']:
-            self._show_status()
-            return True
+        action = _COMMANDS.get(user_input.strip().lower())
+        if not action:
+            return False
         
-        elif command in ['clear history', 'clear_history']:
-            self.assistant.clear_history()
-            print("🗑️ Conversation history cleared")
-            return True
-        
-        return False
+        getattr(self, f"_cmd_{action}")()
+        return True
+    
+    def _cmd_quit(self):
+        """Stop the CLI loop."""
+        print("👋 Goodbye!")
+        self.running = False
+    
+    def _cmd_help(self):
+        """Show available commands."""
+        self._show_help()
+    
+    def _cmd_clear(self):
+        """Clear the screen."""
+        self._clear_screen()
+    
+    def _cmd_history(self):
+        """Show recent exchanges."""
+        self._show_history()
+    
+    def _cmd_status(self):
+        """Show system status."""
+        self._show_status()
+    
+    def _cmd_clear_history(self):
+        """Forget the conversation so far."""
+        self.assistant.clear_history()
+        print("🗑️ Conversation history cleared")
     
     def _display_response(self, response: AIResponse):
         """Display AI response with proper formatting."""
-        print()
-        print("─" * 60)
-        print(f"📝 {response.content}")
-        print("─" * 60)
+        rule = "─" * 60
+        print(f"\n{rule}\n📝 {response.content}\n{rule}")
         
-        # Show metadata in debug mode
+        # Show metadata in debug mode; nothing is built otherwise
         if self.assistant.config.debug:
-            metadata = []
-            metadata.append(f"Provider: {response.provider}")
-            metadata.append(f"Model: {response.model}")
+            metadata = [f"Provider: {response.provider}", f"Model: {response.model}"]
             if response.tokens_used:
                 metadata.append(f"Tokens: {response.tokens_used}")
             if response.confidence:
@@ -143,9 +182,16 @@ class CliInterface:
     
     def _show_welcome(self):
         """Display welcome message."""
+        if self._welcome_banner is None:
+            self._welcome_banner = self._build_welcome_banner()
+        
+        print(self._welcome_banner)
+    
+    def _build_welcome_banner(self) -> str:
+        """Format the welcome message for the current configuration."""
         config = self.assistant.config
         
-        print(f"""
+        lines = [f"""
 ╭─────────────────────────────────────────╮
 │  🤖 {config.name} - AI Assistant                  │
 │  Version {config.version}                         │
@@ -153,49 +199,24 @@ class CliInterface:
 │  Type your questions or 'help' for     │
 │  available commands.                    │
 ╰─────────────────────────────────────────╯
-        """)
+        """]
         
         # Show configuration info
         if config.debug:
-            print(f"🐛 Debug mode: {config.environment}")
+            lines.append(f"🐛 Debug mode: {config.environment}")
         
         # Show available AI providers
-        providers = []
-        if config.gemini_api_key:
-            providers.append("Gemini")
-        if config.openai_api_key:
-            providers.append("OpenAI")
-        if config.anthropic_api_key:
-            providers.append("Anthropic")
-        
-        if providers:
-            print(f"🔑 AI Providers: {', '.join(providers)}")
+        if config.available_providers:
+            lines.append(f"🔑 AI Providers: {', '.join(config.available_providers)}")
         else:
-            print("⚠️  No AI providers configured - using local responses")
+            lines.append("⚠️  No AI providers configured - using local responses")
         
-        print()
+        lines.append("")
+        return "\n".join(lines)
     
     def _show_help(self):
         """Display help information."""
-        print("""
-📖 Available Commands:
-  
-  General:
-  • help, ?           - Show this help message
-  • quit, exit, q     - Exit NOVA
-  • clear, cls        - Clear screen
-  • status, info      - Show system status
-  
-  Conversation:
-  • history, h        - Show conversation history
-  • clear history     - Clear conversation history
-  
-  Examples:
-  • "What is artificial intelligence?"
-  • "Calculate 15 * 24"
-  • "Write a short poem"
-  • "Explain quantum computing"
-        """)
+        print(_HELP_TEXT)
     
     def _clear_screen(self):
         """Clear the terminal screen."""
@@ -211,14 +232,17 @@ class CliInterface:
             print("📝 No conversation history yet")
             return
         
-        print("\n📚 Conversation History:")
-        print("─" * 50)
+        lines = ["\n📚 Conversation History:", "─" * 50]
+        
+        # Show last 5 entries, written out in one print
+        recent = islice(history, max(0, len(history) - 5), None)
+        for i, entry in enumerate(recent, 1):
+            timestamp = datetime.fromtimestamp(entry["timestamp"] / 1e9).strftime("%H:%M:%S")
+            lines.append(f"{i}. [{timestamp}] User: {entry['query'][:50]}...")
+            lines.append(f"   Assistant: {entry['response'][:50]}...")
+            lines.append("")
         
-        for i, entry in enumerate(history[-5:], 1):  # Show last 5 entries
-            timestamp = datetime.fromisoformat(entry["timestamp"]).strftime("%H:%M:%S")
-            print(f"{i}. [{timestamp}] User: {entry['query'][:50]}...")
-            print(f"   Assistant: {entry['response'][:50]}...")
-            print()
+        print("\n".join(lines))
     
     def _show_status(self):
         """Display system status."""
@@ -6,7 +6,11 @@ and coordinates AI responses with a clean, simple architecture.
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any
+import re
+import time
+from collections import deque
+from itertools import islice
+from typing import Optional, Dict, Any, Deque, AsyncIterator
 from datetime import datetime
 
 from .config import NovaConfig
@@ -14,6 +18,32 @@ from .logger import get_logger
 from ..ai.client import AIClient, AIResponse, AIProvider
 
 
+# Query types in priority order, with the keywords that identify them
+_QUERY_TYPES = (
+    ("mathematical", ("+", "-", "*", "/", "calculate", "math")),
+    ("factual", ("what is", "who is", "when was", "where is")),
+    ("explanatory", ("how does", "why does", "explain", "describe")),
+    ("creative", ("create", "write", "generate", "design")),
+    ("greeting", ("hello", "hi", "hey", "greetings")),
+)
+
+# One case-insensitive scan for all keywords. Each alternative is a lookahead,
+# so a keyword can't hide another starting later in the query.
+_QUERY_TYPE_PATTERN = re.compile(
+    "|".join(
+        f"(?=(?P<{query_type}>{'|'.join(map(re.escape, keywords))}))"
+        for query_type, keywords in _QUERY_TYPES
+    ),
+    re.IGNORECASE
+)
+_QUERY_TYPE_PRIORITY = {query_type: priority for priority, (query_type, _) in enumerate(_QUERY_TYPES)}
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """ISO 8601 local time for a history timestamp in nanoseconds."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
 class NovaAssistant:
     """
     Main NOVA AI Assistant.
@@ -26,20 +56,44 @@ class NovaAssistant:
         self.config = config
         self.logger = get_logger("assistant")
         self.ai_client: Optional[AIClient] = None
-        self.conversation_history: List[Dict[str, Any]] = []
+        self._system_prompt = ""
+        # Only the last 10 exchanges are kept
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=10)
         self.is_initialized = False
+        self._initializing: Optional[asyncio.Future] = None
     
     async def initialize(self):
-        """Initialize the assistant and its components."""
+        """
+        Initialize the assistant and its components.
+        
+        Safe to call concurrently: callers arriving while initialization is in
+        progress (e.g. a query during background warmup) wait for the same run.
+        """
         if self.is_initialized:
             return
         
-        self.logger.info(f"Initializing {self.config.name} v{self.config.version}")
+        task = self._initializing
+        if task is None:
+            task = self._initializing = asyncio.ensure_future(self._initialize())
+        try:
+            # Shielded so a cancelled caller doesn't abort it for the others
+            await asyncio.shield(task)
+        finally:
+            # A failed run is dropped so the next call can retry
+            if task.done() and self._initializing is task:
+                self._initializing = None
+    
+    async def _initialize(self):
+        """Create the AI client and build the per-configuration state."""
+        self.logger.info("Initializing %s v%s", self.config.name, self.config.version)
         
         # Initialize AI client
         self.ai_client = AIClient(self.config)
         await self.ai_client._ensure_session()
         
+        # The system prompt only depends on the loaded configuration
+        self._system_prompt = self._build_system_prompt()
+        
         # Log configuration status
         self._log_configuration_status()
         
@@ -48,6 +102,10 @@ class NovaAssistant:
     
     async def shutdown(self):
         """Shutdown the assistant and cleanup resources."""
+        if self._initializing is not None:
+            # Let an in-flight initialization finish so its client gets closed
+            await asyncio.gather(self._initializing, return_exceptions=True)
+        
         if not self.is_initialized:
             return
             
@@ -79,15 +137,11 @@ class NovaAssistant:
         if not self.is_initialized:
             await self.initialize()
         
-        self.logger.info(f"Processing query: {query[:50]}...")
+        self.logger.info("Processing query: %s...", query[:50])
         
         # Build context from conversation history
-        if include_history and self.conversation_history:
-            history_context = self._build_history_context()
-            if context:
-                context = f"{history_context}\n\n{context}"
-            else:
-                context = history_context
+        if include_history:
+            context = self._with_history_context(context)
         
         # Generate AI response
         try:
@@ -97,24 +151,13 @@ class NovaAssistant:
                 system_prompt=self._get_system_prompt()
             )
             
-            # Add to conversation history
-            self.conversation_history.append({
-                "timestamp": datetime.now().isoformat(),
-                "query": query,
-                "response": response.content,
-                "provider": response.provider,
-                "model": response.model
-            })
-            
-            # Keep history manageable
-            if len(self.conversation_history) > 10:
-                self.conversation_history = self.conversation_history[-10:]
+            self._record_exchange(query, response.content, response.provider, response.model)
             
-            self.logger.info(f"Response generated using {response.provider} ({response.model})")
+            self.logger.info("Response generated using %s (%s)", response.provider, response.model)
             return response
             
         except Exception as e:
-            self.logger.error(f"❌ Query processing failed: {e}")
+            self.logger.error("❌ Query processing failed: %s", e)
             
             # Return error response
             return AIResponse(
@@ -124,6 +167,40 @@ class NovaAssistant:
                 error=str(e)
             )
     
+    async def process_query_stream(
+        self,
+        query: str,
+        context: Optional[str] = None,
+        include_history: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Process a user query, yielding the reply as the AI produces it.
+        
+        Same arguments as process_query(); the exchange is added to the
+        conversation history once the reply is complete.
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        self.logger.info("Streaming query: %s...", query[:50])
+        
+        if include_history:
+            context = self._with_history_context(context)
+        
+        chunks = []
+        provider = model = None
+        async for chunk in self.ai_client.stream_response(
+            prompt=query,
+            context=context,
+            system_prompt=self._get_system_prompt()
+        ):
+            chunks.append(chunk.content)
+            provider, model = chunk.provider, chunk.model
+            yield chunk.content
+        
+        self._record_exchange(query, "".join(chunks), provider, model)
+        self.logger.info("Response streamed using %s (%s)", provider, model)
+    
     def clear_history(self):
         """Clear conversation history."""
         self.conversation_history.clear()
@@ -134,37 +211,34 @@ class NovaAssistant:
         if not self.conversation_history:
             return {"message": "No conversation history"}
         
+        history = self.conversation_history
         return {
-            "total_exchanges": len(self.conversation_history),
-            "first_message": self.conversation_history[0]["timestamp"],
-            "last_message": self.conversation_history[-1]["timestamp"],
-            "providers_used": list(set(
-                entry["provider"] for entry in self.conversation_history
-            ))
+            "total_exchanges": len(history),
+            "first_message": _format_timestamp(history[0]["timestamp"]),
+            "last_message": _format_timestamp(history[-1]["timestamp"]),
+            # Deduplicated in first-use order
+            "providers_used": list({entry["provider"]: None for entry in history})
         }
     
     def _log_configuration_status(self):
         """Log the current configuration status."""
-        api_keys = []
-        if self.config.gemini_api_key:
-            api_keys.append("Gemini")
-        if self.config.openai_api_key:
-            api_keys.append("OpenAI")
-        if self.config.anthropic_api_key:
-            api_keys.append("Anthropic")
-        
-        if api_keys:
-            self.logger.info(f"🔑 Available AI providers: {', '.join(api_keys)}")
+        providers = self.config.available_providers
+        if providers:
+            self.logger.info("🔑 Available AI providers: %s", ", ".join(providers))
         else:
             self.logger.warning("⚠️ No AI API keys configured - using local responses only")
         
-        self.logger.info(f"🎯 Default AI model: {self.config.default_ai_model}")
+        self.logger.info("🎯 Default AI model: %s", self.config.default_ai_model)
         
         if self.config.debug:
             self.logger.debug("🐛 Debug mode enabled")
     
     def _get_system_prompt(self) -> str:
         """Get the system prompt for AI models."""
+        return self._system_prompt
+    
+    def _build_system_prompt(self) -> str:
+        """Build the system prompt from the configuration."""
         return f"""You are {self.config.name}, a helpful and professional AI assistant.
 
 Guidelines:
@@ -176,20 +250,37 @@ Guidelines:
 
 Current context: You are running in {self.config.environment} mode."""
     
+    def _with_history_context(self, context: Optional[str]) -> Optional[str]:
+        """Prefix context with the recent conversation history, if any."""
+        if not self.conversation_history:
+            return context
+        
+        history_context = self._build_history_context()
+        if context:
+            return f"{history_context}\n\n{context}"
+        return history_context
+    
+    def _record_exchange(self, query: str, response: str, provider: Optional[str], model: Optional[str]):
+        """Add a completed exchange to the conversation history."""
+        self.conversation_history.append({
+            "timestamp": time.time_ns(),
+            "query": query,
+            "response": response,
+            "provider": provider,
+            "model": model
+        })
+    
     def _build_history_context(self) -> str:
         """Build context string from recent conversation history."""
         if not self.conversation_history:
             return ""
         
         # Use last 3 exchanges for context
-        recent_history = self.conversation_history[-3:]
-        context_parts = []
+        recent_history = islice(self.conversation_history, max(0, len(self.conversation_history) - 3), None)
         
-        for entry in recent_history:
-            context_parts.append(f"User: {entry['query']}")
-            context_parts.append(f"Assistant: {entry['response']}")
-        
-        return "Recent conversation:\n" + "\n".join(context_parts)
+        return "Recent conversation:\n" + "\n".join(
+            f"User: {entry['query']}\nAssistant: {entry['response']}" for entry in recent_history
+        )
 
 
 class QueryProcessor:
@@ -198,20 +289,11 @@ class QueryProcessor:
     @staticmethod
     def classify_query(query: str) -> str:
         """Classify the type of query to optimize processing."""
-        query_lower = query.lower()
-        
-        if any(op in query_lower for op in ['+', '-', '*', '/', 'calculate', 'math']):
-            return "mathematical"
-        elif any(word in query_lower for word in ['what is', 'who is', 'when was', 'where is']):
-            return "factual"
-        elif any(word in query_lower for word in ['how does', 'why does', 'explain', 'describe']):
-            return "explanatory"
-        elif any(word in query_lower for word in ['create', 'write', 'generate', 'design']):
-            return "creative"
-        elif any(word in query_lower for word in ['hello', 'hi', 'hey', 'greetings']):
-            return "greeting"
-        else:
+        # Highest-priority type with a keyword anywhere in the query
+        matched = {match.lastgroup for match in _QUERY_TYPE_PATTERN.finditer(query)}
+        if not matched:
             return "general"
+        return min(matched, key=_QUERY_TYPE_PRIORITY.__getitem__)
     
     @staticmethod
     def extract_intent(query: str) -> Dict[str, Any]:
@@ -6,16 +6,104 @@ with professional error handling and type safety.
 """
 
 import os
+import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Set, Tuple
 from dotenv import load_dotenv
 
 
-@dataclass
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() == "true"
+
+
+# Environment variables read by NovaConfig.load: (field, variable, parser)
+_ENV_FIELDS = (
+    ("name", "NOVA_NAME", str),
+    ("environment", "NOVA_ENV", str),
+    ("debug", "NOVA_DEBUG", _env_bool),
+    ("log_level", "NOVA_LOG_LEVEL", str),
+    
+    # Directories
+    ("data_dir", "NOVA_DATA_DIR", Path),
+    ("cache_dir", "NOVA_CACHE_DIR", Path),
+    ("logs_dir", "NOVA_LOGS_DIR", Path),
+    
+    # API
+    ("api_host", "API_HOST", str),
+    ("api_port", "API_PORT", int),
+    
+    # AI Models
+    ("default_ai_model", "DEFAULT_AI_MODEL", str),
+    ("gemini_model", "GEMINI_MODEL", str),
+    ("openai_model", "OPENAI_MODEL", str),
+    ("anthropic_model", "ANTHROPIC_MODEL", str),
+    ("fallback_model", "FALLBACK_MODEL", str),
+    
+    # API Keys
+    ("gemini_api_key", "GEMINI_API_KEY", str),
+    ("openai_api_key", "OPENAI_API_KEY", str),
+    ("anthropic_api_key", "ANTHROPIC_API_KEY", str),
+    
+    # AI Settings
+    ("ai_temperature", "AI_TEMPERATURE", float),
+    ("ai_max_tokens", "AI_MAX_TOKENS", int),
+    ("ai_timeout", "AI_TIMEOUT", int),
+    ("ai_retry_attempts", "AI_RETRY_ATTEMPTS", int),
+    
+    # Features
+    ("enable_voice", "ENABLE_VOICE", _env_bool),
+    ("enable_vision", "ENABLE_VISION", _env_bool),
+    ("enable_web_search", "ENABLE_WEB_SEARCH", _env_bool),
+    ("enable_file_operations", "ENABLE_FILE_OPERATIONS", _env_bool),
+)
+
+# Environment files probed by NovaConfig.load when no path is given
+_DOTENV_FILES = (".env", ".env.local", "config/.env")
+
+@lru_cache(maxsize=8)
+def _load_env_file(path: str):
+    """Load an environment file into os.environ, once per path."""
+    # Variables already set, including ones from an earlier load, take precedence,
+    # so parsing the file again could never change the environment
+    load_dotenv(path, override=False)
+
+
+@lru_cache(maxsize=8)
+def _config_from_env(cls: type, env_values: Tuple[Tuple[str, str], ...]) -> "NovaConfig":
+    """Build a config from (field, raw value) pairs; unset fields keep their defaults."""
+    parsers = {attr: parse for attr, _, parse in _ENV_FIELDS}
+    return cls(**{attr: parsers[attr](value) for attr, value in env_values})
+
+
+# dataclass(slots=True) needs Python 3.10+; older versions get a regular frozen dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Directory sets already created and write-tested by this process
+_checked_directories: Set[Tuple[Path, ...]] = set()
+
+
+def _test_directory(entry: Tuple[str, Path]) -> Optional[str]:
+    """Create a directory and test write access; returns the issue, if any."""
+    name, directory = entry
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # Test write access
+        test_file = directory / ".write_test"
+        test_file.touch()
+        test_file.unlink()
+    except Exception as e:
+        return f"Cannot write to {name} directory ({directory}): {e}"
+    return None
+
+
+@dataclass(frozen=True, **_SLOTS)
 class NovaConfig:
-    """Professional configuration class for NOVA."""
+    """Professional configuration class for NOVA (immutable once loaded)."""
     
     # Core Settings
     name: str = "NOVA"
@@ -57,58 +145,31 @@ class NovaConfig:
     enable_web_search: bool = False
     enable_file_operations: bool = True
     
+    # Names of the AI providers with an API key, derived in __post_init__
+    available_providers: Tuple[str, ...] = field(default=(), init=False, repr=False)
+    
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> "NovaConfig":
-        """Load configuration from environment file."""
-        if config_path:
-            load_dotenv(config_path)
-        else:
-            # Try multiple common config file locations
-            config_files = [".env", ".env.local", "config/.env"]
-            for config_file in config_files:
-                if Path(config_file).exists():
-                    load_dotenv(config_file)
-                    break
+        """
+        Load configuration from environment file.
         
-        return cls(
-            name=os.getenv("NOVA_NAME", "NOVA"),
-            environment=os.getenv("NOVA_ENV", "development"),
-            debug=os.getenv("NOVA_DEBUG", "false").lower() == "true",
-            log_level=os.getenv("NOVA_LOG_LEVEL", "INFO"),
-            
-            # Directories
-            data_dir=Path(os.getenv("NOVA_DATA_DIR", "./data")),
-            cache_dir=Path(os.getenv("NOVA_CACHE_DIR", "./cache")),
-            logs_dir=Path(os.getenv("NOVA_LOGS_DIR", "./logs")),
-            
-            # API
-            api_host=os.getenv("API_HOST", "localhost"),
-            api_port=int(os.getenv("API_PORT", "8000")),
-            
-            # AI Models
-            default_ai_model=os.getenv("DEFAULT_AI_MODEL", "fallback"),
-            gemini_model=os.getenv("GEMINI_MODEL", "gemini-1.5-pro"),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-3.5-turbo"),
-            anthropic_model=os.getenv("ANTHROPIC_MODEL", "claude-3-sonnet-20240229"),
-            fallback_model=os.getenv("FALLBACK_MODEL", "local"),
+        Each environment file is parsed once per process, and the same
+        environment yields the same (immutable) config instance.
+        """
+        # Try the given file, or multiple common config file locations; the first one found wins
+        for config_file in (config_path,) if config_path else _DOTENV_FILES:
+            if not os.path.isfile(config_file):
+                continue
             
-            # API Keys
-            gemini_api_key=os.getenv("GEMINI_API_KEY"),
-            openai_api_key=os.getenv("OPENAI_API_KEY"),
-            anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
-            
-            # AI Settings
-            ai_temperature=float(os.getenv("AI_TEMPERATURE", "0.7")),
-            ai_max_tokens=int(os.getenv("AI_MAX_TOKENS", "2048")),
-            ai_timeout=int(os.getenv("AI_TIMEOUT", "30")),
-            ai_retry_attempts=int(os.getenv("AI_RETRY_ATTEMPTS", "3")),
-            
-            # Features
-            enable_voice=os.getenv("ENABLE_VOICE", "false").lower() == "true",
-            enable_vision=os.getenv("ENABLE_VISION", "false").lower() == "true",
-            enable_web_search=os.getenv("ENABLE_WEB_SEARCH", "false").lower() == "true",
-            enable_file_operations=os.getenv("ENABLE_FILE_OPERATIONS", "true").lower() == "true",
-        )
+            _load_env_file(os.path.abspath(config_file))
+            break
+        
+        environ = os.environ
+        return _config_from_env(cls, tuple(
+            (attr, environ[env_name])
+            for attr, env_name, _ in _ENV_FIELDS
+            if env_name in environ
+        ))
     
     def create_directories(self):
         """Create necessary directories if they don't exist."""
@@ -121,24 +182,11 @@ class NovaConfig:
         warnings = []
         
         # Check if at least one AI API key is configured
-        api_keys = [self.gemini_api_key, self.openai_api_key, self.anthropic_api_key]
-        if not any(api_keys):
+        if not self.available_providers:
             warnings.append("No AI API keys configured - only local fallback responses will be available")
         
         # Validate directories are writable
-        for name, directory in [
-            ("data", self.data_dir),
-            ("cache", self.cache_dir),
-            ("logs", self.logs_dir)
-        ]:
-            try:
-                directory.mkdir(parents=True, exist_ok=True)
-                # Test write access
-                test_file = directory / ".write_test"
-                test_file.touch()
-                test_file.unlink()
-            except Exception as e:
-                issues.append(f"Cannot write to {name} directory ({directory}): {e}")
+        issues.extend(self._check_directories())
         
         # Validate AI settings
         if not 0.0 <= self.ai_temperature <= 2.0:
@@ -156,20 +204,47 @@ class NovaConfig:
             "warnings": warnings
         }
     
+    def _check_directories(self) -> List[str]:
+        """Create the data directories and test write access, once per process."""
+        directories = (self.data_dir, self.cache_dir, self.logs_dir)
+        if directories in _checked_directories:
+            return []
+        
+        # An existing writable directory needs no test file
+        to_test = [
+            (name, directory)
+            for name, directory in zip(("data", "cache", "logs"), directories)
+            if not (directory.is_dir() and os.access(directory, os.W_OK))
+        ]
+        
+        issues = []
+        if to_test:
+            # The directories are independent, so their filesystem round trips overlap
+            with ThreadPoolExecutor(max_workers=len(to_test)) as executor:
+                issues = [issue for issue in executor.map(_test_directory, to_test) if issue]
+        
+        # Failures are checked again next time, the directory may have been fixed
+        if not issues:
+            _checked_directories.add(directories)
+        return issues
+    
     def __post_init__(self):
         """Post-initialization validation and setup."""
+        # Frozen dataclass: derived and normalized fields are set through object.__setattr__
         # Convert string paths to Path objects if needed
-        if isinstance(self.data_dir, str):
-            self.data_dir = Path(self.data_dir)
-        if isinstance(self.cache_dir, str):
-            self.cache_dir = Path(self.cache_dir)
-        if isinstance(self.logs_dir, str):
-            self.logs_dir = Path(self.logs_dir)
+        for name in ("data_dir", "cache_dir", "logs_dir"):
+            if isinstance(getattr(self, name), str):
+                object.__setattr__(self, name, Path(getattr(self, name)))
         
-        # Create directories
-        self.create_directories()
+        object.__setattr__(self, "available_providers", tuple(
+            provider for provider, api_key in [
+                ("Gemini", self.gemini_api_key),
+                ("OpenAI", self.openai_api_key),
+                ("Anthropic", self.anthropic_api_key)
+            ] if api_key
+        ))
         
-        # Validate configuration
+        # Validate configuration (this also creates the directories)
         validation = self.validate()
         if not validation["valid"]:
             logger = logging.getLogger(__name__)
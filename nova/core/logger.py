@@ -12,6 +12,11 @@ from pathlib import Path
 from typing import Optional
 
 
+# Library default: nova records stay silent until setup_logging() (or the
+# application's own root logging) gives them somewhere to go
+logging.getLogger("nova").addHandler(logging.NullHandler())
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color codes for terminal output."""
     
@@ -24,12 +29,24 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
-    def format(self, record):
-        # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         
-        return super().format(record)
+        # Colored level names, built once instead of per record
+        reset = self.COLORS['RESET']
+        self._colored_levels = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+    
+    def format(self, record):
+        # Color the levelname for this output only; other handlers share the record
+        levelname = record.levelname
+        record.levelname = self._colored_levels.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(
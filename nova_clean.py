@@ -13,17 +13,11 @@ A clean, professional implementation focusing on:
 import asyncio
 import logging
 import sys
-from pathlib import Path
-from typing import Optional
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import AsyncIterator, Iterable, List, Optional
 
-# Add project root to Python path
-PROJECT_ROOT = Path(__file__).parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
-from nova.core.config import NovaConfig
-from nova.core.logger import setup_logging
-from nova.core.assistant import NovaAssistant
-from nova.cli.interface import CliInterface
+from core.event_loop import run_event_loop
 
 
 class Nova:
@@ -31,37 +25,95 @@ class Nova:
     
     def __init__(self, config_path: Optional[str] = None):
         """Initialize NOVA with configuration."""
+        # Imported here so --help and argument errors don't load the AI stack
+        from nova.core.config import NovaConfig
+        from nova.core.logger import setup_logging
+        from nova.core.assistant import NovaAssistant
+        
         self.config = NovaConfig.load(config_path)
         self.logger = setup_logging(self.config.log_level)
         self.assistant = NovaAssistant(self.config)
-        self.cli = CliInterface(self.assistant)
+        self.cli = None
         
     async def start(self):
         """Start NOVA in interactive mode."""
         try:
             self.logger.info("🚀 Starting NOVA - Neural Omnipresent Virtual Assistant")
-            await self.assistant.initialize()
-            await self.cli.start()
+            
+            # Only interactive mode needs the CLI
+            from nova.cli.interface import CliInterface
+            self.cli = CliInterface(self.assistant)
+            
+            # Warm the assistant up in the background so the prompt shows right
+            # away; the first query waits for it through initialize()
+            if sys.version_info >= (3, 11):
+                # The group cancels the warmup if the CLI fails, and waits for it otherwise
+                async with asyncio.TaskGroup() as group:
+                    group.create_task(self._warmup())
+                    await self.cli.start()
+            else:
+                warmup = asyncio.ensure_future(self._warmup())
+                try:
+                    await self.cli.start()
+                except BaseException:
+                    warmup.cancel()
+                    raise
+                finally:
+                    await asyncio.gather(warmup, return_exceptions=True)
         except KeyboardInterrupt:
             self.logger.info("👋 NOVA shutdown requested by user")
         except Exception as e:
-            self.logger.error(f"❌ NOVA startup failed: {e}")
+            self.logger.error("❌ NOVA startup failed: %s", e)
             raise
         finally:
             await self.assistant.shutdown()
             
+    async def _warmup(self):
+        """Initialize the assistant, logging a failure; the first query retries it."""
+        try:
+            await self.assistant.initialize()
+        except Exception as e:
+            self.logger.error("❌ NOVA warmup failed: %s", e)
+    
     async def process_single_query(self, query: str) -> str:
-        """Process a single query and return the response."""
+        """
+        Process a single query and return the response.
+        
+        The assistant is initialized on first use and kept warm for further
+        queries; call shutdown() when done.
+        """
         await self.assistant.initialize()
+        response = await self.assistant.process_query(query)
+        return response.content
+    
+    async def stream_single_query(self, query: str) -> AsyncIterator[str]:
+        """Process a single query, yielding the response as it is generated."""
+        await self.assistant.initialize()
+        async for chunk in self.assistant.process_query_stream(query):
+            yield chunk
+    
+    async def run_queries(self, queries: Iterable[str]):
+        """Answer queries in order on one warm assistant, printing each response as it streams."""
         try:
-            response = await self.assistant.process_query(query)
-            return response.content
+            for query in queries:
+                query = query.strip()
+                if not query:
+                    continue
+                async for chunk in self.stream_single_query(query):
+                    sys.stdout.write(chunk)
+                    sys.stdout.flush()
+                print()
         finally:
-            await self.assistant.shutdown()
+            await self.shutdown()
+    
+    async def shutdown(self):
+        """Release the assistant's resources."""
+        await self.assistant.shutdown()
 
 
-def main():
-    """Main entry point for NOVA."""
+@lru_cache(maxsize=None)
+def build_parser():
+    """Command line parser, built once per process."""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -71,13 +123,14 @@ def main():
 Examples:
   %(prog)s                    # Start interactive mode
   %(prog)s -q "Hello NOVA"    # Process single query
+  %(prog)s -q - < queries.txt # Process one query per line from stdin
   %(prog)s --config custom.env # Use custom config
         """
     )
     
     parser.add_argument(
         "-q", "--query",
-        help="Process a single query and exit"
+        help="Process a single query and exit ('-' reads one query per line from stdin)"
     )
     parser.add_argument(
         "--config",
@@ -89,24 +142,43 @@ Examples:
         help="Enable verbose logging"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv: Optional[List[str]] = None):
+    """Parse command line arguments."""
+    argv = sys.argv[1:] if argv is None else argv
+    # Plain `python nova_clean.py` is the common launch; skip building the
+    # parser (and importing argparse) when there is nothing to parse
+    if not argv:
+        return SimpleNamespace(query=None, config=None, verbose=False)
+    return build_parser().parse_args(argv)
+
+
+def main():
+    """Main entry point for NOVA."""
+    args = parse_arguments()
     
-    # Set up basic logging for startup
+    # Set up basic logging for startup; timestamps only when verbose
+    logging.logThreads = logging.logProcesses = logging.logMultiprocessing = False
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        format=(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s" if args.verbose
+            else "%(levelname)s %(name)s: %(message)s"
+        )
     )
     
     nova = Nova(args.config)
     
     try:
         if args.query:
-            # Single query mode
-            response = asyncio.run(nova.process_single_query(args.query))
-            print(response)
+            # Single query mode; queries from stdin share one initialized assistant
+            queries = sys.stdin if args.query == "-" else [args.query]
+            run_event_loop(nova.run_queries(queries))
         else:
             # Interactive mode
-            asyncio.run(nova.start())
+            run_event_loop(nova.start())
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
     except Exception as e:
@@ -3,8 +3,7 @@ import aiohttp
 import os
 from dotenv import load_dotenv
 
-async def quick_gemini_test():
-    load_dotenv()
+async def quick_gemini_test(session: aiohttp.ClientSession):
     api_key = os.getenv("GEMINI_API_KEY")
     print(f"API Key: {api_key[:20]}...")
     
@@ -15,10 +14,29 @@ async def quick_gemini_test():
         "generationConfig": {"maxOutputTokens": 20}
     }
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, json=data) as response:
-            print(f"Status: {response.status}")
-            result = await response.text()
-            print(f"Response: {result[:200]}...")
+    async with session.post(url, json=data) as response:
+        print(f"Status: {response.status}")
+        result = await response.text()
+        print(f"Response: {result[:200]}...")
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Keep-alive session for the quick API tests, reused across their calls"""
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+
+
+async def main():
+    # Once per run, not per test call
+    load_dotenv()
+    async with create_session() as session:
+        await quick_gemini_test(session)
+
 
-asyncio.run(quick_gemini_test())
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,8 +3,9 @@ import aiohttp
 import os
 from dotenv import load_dotenv
 
-async def quick_openai_test():
-    load_dotenv()
+from quick_api_test import create_session
+
+async def quick_openai_test(session: aiohttp.ClientSession):
     api_key = os.getenv("OPENAI_API_KEY")
     print(f"OpenAI API Key: {api_key[:20]}...")
     
@@ -17,10 +18,18 @@ async def quick_openai_test():
         "max_tokens": 20
     }
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            print(f"Status: {response.status}")
-            result = await response.text()
-            print(f"Response: {result[:300]}...")
+    async with session.post(url, headers=headers, json=data) as response:
+        print(f"Status: {response.status}")
+        result = await response.text()
+        print(f"Response: {result[:300]}...")
+
+
+async def main():
+    # Once per run, not per test call
+    load_dotenv()
+    async with create_session() as session:
+        await quick_openai_test(session)
+
 
-asyncio.run(quick_openai_test())
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,18 +7,14 @@ Simple launcher without emoji logging for Windows compatibility
 import asyncio
 import logging
 import sys
-from pathlib import Path
-
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 from core.brain import NOVABrain, NOVAConfig
+from core.event_loop import run_event_loop
 from core.memory import MemorySystem
 from core.personality import PersonalityEngine
 from core.orchestrator import AgentOrchestrator
 from core.security import SecurityCore
-from interfaces.api import create_nova_api
+from interfaces.api import create_nova_api, uvicorn_options
 from interfaces.cli import NOVACLIInterface
 
 class NOVAMain:
@@ -26,10 +22,12 @@ class NOVAMain:
     
     def __init__(self):
         self.config = NOVAConfig()
-        # Simple logger setup without emojis
+        # Simple logger setup without emojis. No timestamps or thread/process
+        # lookups, which cost more per record than the messages themselves
+        logging.logThreads = logging.logProcesses = logging.logMultiprocessing = False
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            format='%(levelname)s %(name)s: %(message)s'
         )
         self.logger = logging.getLogger(__name__)
         
@@ -43,24 +41,34 @@ class NOVAMain:
         # Interfaces
         self.api = None
         self.cli = None
+        self.server = None
         
         # Runtime state
         self.running = False
-        self.tasks = []
         
     async def initialize(self):
         """Initialize all NOVA components"""
         try:
             self.logger.info("Initializing NOVA...")
             
-            # Initialize memory system
+            # Create memory system, security core and agent orchestrator
             self.memory = MemorySystem(self.config.memory)
-            await self.memory.initialize()
+            # SecurityCore falls back to its defaults when no settings are configured
+            self.security = SecurityCore(getattr(self.config, 'security', None))
+            self.orchestrator = AgentOrchestrator(self.config.agents)
             
-            # Initialize security core
-            security_config = getattr(self.config, 'security', {})
-            self.security = SecurityCore(security_config)
-            await self.security.initialize()
+            # They don't depend on each other, so initialize them concurrently
+            results = await asyncio.gather(
+                self.memory.initialize(),
+                self.security.initialize(),
+                self.orchestrator.initialize(),
+                return_exceptions=True
+            )
+            errors = [result for result in results if isinstance(result, Exception)]
+            for error in errors:
+                self.logger.error("Component initialization failed: %s", error)
+            if errors:
+                raise errors[0]
             
             # Initialize personality engine
             self.personality = PersonalityEngine(self.config.personality)
@@ -68,10 +76,6 @@ class NOVAMain:
             # Initialize brain
             self.brain = NOVABrain(self.config)
             
-            # Initialize agent orchestrator
-            self.orchestrator = AgentOrchestrator(self.config.agents)
-            await self.orchestrator.initialize()
-            
             # Initialize interfaces
             self.api = create_nova_api(self.brain, self.config)
             self.cli = NOVACLIInterface(self.brain)
@@ -80,7 +84,7 @@ class NOVAMain:
             return True
             
         except Exception as e:
-            self.logger.error(f"NOVA initialization failed: {e}")
+            self.logger.error("NOVA initialization failed: %s", e)
             return False
     
     async def run(self):
@@ -94,24 +98,28 @@ class NOVAMain:
         try:
             if mode == 'api':
                 self.logger.info("Starting NOVA in API mode...")
-                # Start API server
+                # Serve on the running loop; uvicorn.run() would try to start another.
+                # log_config=None keeps the logging set up in __init__
                 import uvicorn
-                uvicorn.run(
+                self.server = uvicorn.Server(uvicorn.Config(
                     self.api,
                     host=self.config.runtime.api_host,
-                    port=self.config.runtime.api_port
-                )
+                    port=self.config.runtime.api_port,
+                    log_config=None,
+                    **uvicorn_options()
+                ))
+                await self.server.serve()
             elif mode == 'cli':
                 self.logger.info("Starting NOVA in CLI mode...")
                 await self.cli.start()
             else:
-                self.logger.error(f"Unknown mode: {mode}")
+                self.logger.error("Unknown mode: %s", mode)
                 return False
                 
         except KeyboardInterrupt:
             self.logger.info("Received shutdown signal")
         except Exception as e:
-            self.logger.error(f"Runtime error: {e}")
+            self.logger.error("Runtime error: %s", e)
             return False
         finally:
             await self.shutdown()
@@ -123,10 +131,9 @@ class NOVAMain:
         self.logger.info("Shutting down NOVA...")
         self.running = False
         
-        # Cancel all tasks
-        for task in self.tasks:
-            if not task.done():
-                task.cancel()
+        # Ask the API server to stop accepting requests
+        if self.server:
+            self.server.should_exit = True
         
         # Shutdown components
         if self.orchestrator:
@@ -145,8 +152,8 @@ async def main():
         success = await nova.run()
         sys.exit(0 if success else 1)
     except Exception as e:
-        logging.error(f"Critical error: {e}")
+        logging.error("Critical error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -7,10 +7,6 @@ by directly testing the AI client and enhanced question answering.
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.append(str(Path(__file__).parent))
 
 async def test_ai_capabilities():
     """Test the enhanced AI capabilities"""
@@ -20,7 +16,7 @@ async def test_ai_capabilities():
     
     # Test 1: Import the AI Client
     try:
-        from core.ai_client import EnhancedQuestionAnswering, AIClient
+        from core.ai_client import get_enhanced_qa
         print("✅ AI Client imported successfully")
     except ImportError as e:
         print(f"❌ Failed to import AI Client: {e}")
@@ -28,7 +24,8 @@ async def test_ai_capabilities():
     
     # Test 2: Initialize Enhanced QA
     try:
-        enhanced_qa = EnhancedQuestionAnswering()
+        # Shared with the Research Agent below
+        enhanced_qa = get_enhanced_qa()
         print("✅ Enhanced Question Answering initialized")
     except Exception as e:
         print(f"❌ Failed to initialize Enhanced QA: {e}")
@@ -44,9 +41,10 @@ async def test_ai_capabilities():
     ]
     
     print("\n🔍 Testing Question Classification:")
-    for question in test_questions:
-        question_type = enhanced_qa._classify_question(question)
-        print(f"   '{question}' → {question_type}")
+    sys.stdout.write("".join(
+        f"   '{question}' → {question_type}\n"
+        for question, question_type in zip(test_questions, enhanced_qa.classify_batch(test_questions))
+    ))
     
     # Test 4: Test AI Response (without requiring API keys)
     print("\n🤖 Testing AI Response Generation:")
@@ -75,6 +73,8 @@ async def test_ai_capabilities():
         # Check if enhanced capabilities are available
         if hasattr(research_agent, 'enhanced_qa') and research_agent.enhanced_qa:
             print("✅ Enhanced AI capabilities integrated into Research Agent")
+            if research_agent.enhanced_qa is enhanced_qa:
+                print("✅ Research Agent shares the Enhanced QA instance")
         else:
             print("⚠️  Enhanced AI capabilities not integrated (may require API keys)")
             
@@ -84,9 +84,8 @@ async def test_ai_capabilities():
     # Test 6: Configuration Check
     print("\n⚙️  Testing Configuration:")
     try:
+        # .env was already loaded when core.ai_client was imported
         import os
-        from dotenv import load_dotenv
-        load_dotenv()
         
         gemini_key = os.getenv("GEMINI_API_KEY", "not_set")
         default_model = os.getenv("DEFAULT_AI_MODEL", "not_set")
@@ -1,15 +1,15 @@
 import asyncio
+import io
 import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent))
+from contextlib import redirect_stdout
 
 async def test_fallback_responses():
     print("🧪 Testing Enhanced Fallback Responses")
     print("=" * 40)
     
-    from core.ai_client import EnhancedQuestionAnswering, AIModelType
+    from core.ai_client import get_enhanced_qa
     
-    enhanced_qa = EnhancedQuestionAnswering()
+    enhanced_qa = get_enhanced_qa()
     
     test_questions = [
         "Hello!",
@@ -20,13 +20,26 @@ async def test_fallback_responses():
         "What can you do?"
     ]
     
-    for question in test_questions:
-        print(f"\n❓ Question: {question}")
-        result = await enhanced_qa.answer_question(question)
-        print(f"📋 Answer: {result['answer']}")
-        print(f"🤖 Model: {result.get('model_used', 'unknown')}")
-        print(f"📊 Status: {result['status']}")
-        
+    # The questions are independent, so ask them all at once
+    results = await asyncio.gather(
+        *(enhanced_qa.answer_question(question) for question in test_questions),
+        return_exceptions=True
+    )
+    
+    # Print all the answers with a single write
+    report = io.StringIO()
+    with redirect_stdout(report):
+        for question, result in zip(test_questions, results):
+            print(f"\n❓ Question: {question}")
+            if isinstance(result, Exception):
+                print(f"❌ Error: {result}")
+                continue
+            print(f"📋 Answer: {result['answer']}")
+            print(f"🤖 Model: {result.get('model_used', 'unknown')}")
+            print(f"📊 Status: {result['status']}")
+            
+    sys.stdout.write(report.getvalue())
+    
     await enhanced_qa.close()
     print("\n✅ Test complete!")
 
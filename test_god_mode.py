@@ -6,9 +6,9 @@ the enhanced AI fallback system.
 """
 
 import asyncio
+import io
 import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent))
+from contextlib import redirect_stdout
 
 async def test_god_mode_responses():
     print("👑 Testing God Mode with Enhanced Fallback")
@@ -55,12 +55,10 @@ async def test_god_mode_responses():
         }
     ]
     
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n🧪 Test {i}: {test_case['description']}")
-        
-        # Create task like God Mode does
-        from datetime import datetime
-        task = Task(
+    # Create tasks like God Mode does
+    from datetime import datetime
+    tasks = [
+        Task(
             id=f"test-{i}",
             type=AgentType.RESEARCH,
             description=test_case['description'],
@@ -68,21 +66,42 @@ async def test_god_mode_responses():
             parameters=test_case['parameters'],
             created_at=datetime.now()
         )
-        
-        try:
-            result = await research_agent.execute_task(task)
-            
-            print(f"📋 Status: {result.get('status', 'unknown')}")
-            print(f"🤖 Answer: {result.get('answer', 'No answer provided')}")
+        for i, test_case in enumerate(test_cases, 1)
+    ]
+    
+    # The tasks are independent, so run them all at once
+    results = await asyncio.gather(
+        *(research_agent.execute_task(task) for task in tasks),
+        return_exceptions=True
+    )
+    
+    # Print all the results with a single write
+    report = io.StringIO()
+    with redirect_stdout(report):
+        for i, (test_case, result) in enumerate(zip(test_cases, results), 1):
+            print(f"\n🧪 Test {i}: {test_case['description']}")
             
-            if result.get('explanation'):
-                print(f"💡 Explanation: {result.get('explanation')}")
+            try:
+                if isinstance(result, Exception):
+                    raise result
                 
-            if result.get('model_used'):
-                print(f"🔧 Model: {result.get('model_used')}")
+                print(f"📋 Status: {result.get('status', 'unknown')}")
+                print(f"🤖 Answer: {result.get('answer', 'No answer provided')}")
                 
-        except Exception as e:
-            print(f"❌ Error: {e}")
+                if result.get('explanation'):
+                    print(f"💡 Explanation: {result.get('explanation')}")
+                    
+                if result.get('model_used'):
+                    print(f"🔧 Model: {result.get('model_used')}")
+                    
+            except Exception as e:
+                print(f"❌ Error: {e}")
+        
+    sys.stdout.write(report.getvalue())
+    
+    # Release the shared AI client's HTTP session
+    if research_agent.enhanced_qa:
+        await research_agent.enhanced_qa.close()
     
     print("\n🎉 God Mode testing complete!")
     print("\n💡 To test interactively:")
@@ -5,16 +5,16 @@ Test script to verify NOVA setup and basic functionality
 import asyncio
 import sys
 import traceback
-from pathlib import Path
-
-# Add project root to path
-sys.path.append(str(Path(__file__).parent))
+from typing import Optional
 
 from core.brain import NOVABrain, NOVAConfig
+from core.memory import MemorySystem
+from core.orchestrator import AgentOrchestrator
+from core.personality import PersonalityEngine
 
 
-async def test_nova_basic_functionality():
-    """Test basic NOVA functionality"""
+async def start_test_brain() -> Optional[NOVABrain]:
+    """Create and initialize the brain shared by all tests"""
     
     print("🧠 Testing NOVA Basic Functionality")
     print("=" * 50)
@@ -39,10 +39,22 @@ async def test_nova_basic_functionality():
         
         if init_success:
             print("✅ NOVA brain initialized successfully")
-        else:
-            print("❌ NOVA brain initialization failed")
-            return False
+            return brain
         
+        print("❌ NOVA brain initialization failed")
+        return None
+        
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        print("\nFull traceback:")
+        traceback.print_exc()
+        return None
+
+
+async def test_nova_basic_functionality(brain: NOVABrain):
+    """Test basic NOVA functionality"""
+    
+    try:
         # Test 3: Get status
         print("\n3. Testing status retrieval...")
         status = await brain.get_status()
@@ -68,11 +80,6 @@ async def test_nova_basic_functionality():
         print(f"   God mode status: {god_result.get('status', 'unknown')}")
         print("✅ God mode tested successfully")
         
-        # Test 6: Cleanup
-        print("\n6. Testing cleanup...")
-        await brain.shutdown()
-        print("✅ Cleanup completed successfully")
-        
         print("\n" + "=" * 50)
         print("🎉 All tests passed! NOVA is working correctly.")
         return True
@@ -84,19 +91,29 @@ async def test_nova_basic_functionality():
         return False
 
 
-async def test_components():
-    """Test individual components"""
+async def test_components(brain: Optional[NOVABrain]):
+    """
+    Test individual components, reusing the ones the brain initialized
+    
+    Without a brain each component is built on its own, so a component that
+    broke brain initialization is still pinpointed.
+    """
     
     print("\n🔧 Testing Individual Components")
     print("=" * 50)
     
+    standalone = brain is None
+    if standalone:
+        print("   Brain unavailable - testing standalone components")
+    
     try:
         # Test memory system
         print("\n1. Testing memory system...")
-        from core.memory import MemorySystem
-        
-        memory = MemorySystem("test_memory.db")
-        await memory.initialize()
+        if standalone:
+            memory = MemorySystem("test_memory.db")
+            await memory.initialize()
+        else:
+            memory = brain.memory
         
         # Test storing and retrieving
         memory_id = await memory.store_interaction({
@@ -107,14 +124,16 @@ async def test_components():
         if memory_id:
             print("✅ Memory system working")
         
-        await memory.cleanup()
+        if standalone:
+            await memory.cleanup()
         
         # Test personality engine
         print("\n2. Testing personality engine...")
-        from core.personality import PersonalityEngine
-        
-        personality = PersonalityEngine("assistant")
-        await personality.initialize()
+        if standalone:
+            personality = PersonalityEngine("assistant")
+            await personality.initialize()
+        else:
+            personality = brain.personality
         
         style = personality.get_response_style({"type": "casual"})
         if style:
@@ -122,16 +141,18 @@ async def test_components():
         
         # Test orchestrator
         print("\n3. Testing orchestrator...")
-        from core.orchestrator import AgentOrchestrator
-        
-        orchestrator = AgentOrchestrator()
-        await orchestrator.initialize()
+        if standalone:
+            orchestrator = AgentOrchestrator()
+            await orchestrator.initialize()
+        else:
+            orchestrator = brain.orchestrator
         
         agents = await orchestrator.get_active_agents()
         print(f"   Active agents: {len(agents)}")
         print("✅ Orchestrator working")
         
-        await orchestrator.shutdown()
+        if standalone:
+            await orchestrator.shutdown()
         
         return True
         
@@ -148,11 +169,24 @@ async def main():
     print("Testing NOVA functionality and components")
     print("=" * 60)
     
-    # Test basic functionality
-    basic_test_passed = await test_nova_basic_functionality()
+    # Initialize the brain once; every test below reuses it
+    brain = await start_test_brain()
+    basic_test_passed = False
     
-    # Test components
-    component_test_passed = await test_components()
+    if brain:
+        try:
+            # Test basic functionality
+            basic_test_passed = await test_nova_basic_functionality(brain)
+            
+            # Test components
+            component_test_passed = await test_components(brain)
+        finally:
+            print("\n🧹 Testing cleanup...")
+            await brain.shutdown()
+            print("✅ Cleanup completed successfully")
+    else:
+        # Still check each component on its own to find the one that failed
+        component_test_passed = await test_components(None)
     
     # Summary
     print("\n" + "=" * 60)
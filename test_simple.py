@@ -6,20 +6,16 @@ Simple NOVA test launcher
 import asyncio
 import logging
 import sys
-from pathlib import Path
-
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 from core.brain import NOVABrain, NOVAConfig
 
 async def main():
     """Simple test of NOVA brain"""
-    # Setup basic logging
+    # Setup basic logging, without timestamps or thread/process lookups
+    logging.logThreads = logging.logProcesses = logging.logMultiprocessing = False
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        format='%(levelname)s %(name)s: %(message)s'
     )
     logger = logging.getLogger(__name__)
     
@@ -46,7 +42,7 @@ async def main():
         logger.info("NOVA test completed successfully!")
         
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         import traceback
         traceback.print_exc()
         sys.exit(1)
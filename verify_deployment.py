@@ -2,148 +2,153 @@
 """
 NOVA Deployment Verification Script
 Quick verification that all components are properly installed and configured
+
+Pass --quick to only check that each component's module is present, without
+importing it (and its dependencies).
 """
 
+import importlib
+import importlib.util
+import io
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 
-print("🚀 NOVA Deployment Verification")
-print("=" * 50)
+# (label, module, names it must provide), grouped by report section
+IMPORT_SECTIONS = [
+    ("📦 Testing Core Imports...", [
+        ("NOVA Brain", "core.brain", ("NOVABrain", "NOVAConfig")),
+        ("Agent Orchestrator", "core.orchestrator", ("AgentOrchestrator", "AgentType")),
+        ("Memory System", "core.memory", ("MemorySystem",)),
+        ("Personality Engine", "core.personality", ("PersonalityEngine",)),
+        ("Security Core", "core.security", ("SecurityCore",)),
+    ]),
+    ("🤖 Testing Agent Imports...", [
+        ("Life Manager Agent", "agents.life_manager", ("LifeManagerAgent",)),
+        ("Finance Agent", "agents.finance", ("FinanceAgent",)),
+        ("Data Analyst Agent", "agents.data_analyst", ("DataAnalystAgent",)),
+        ("Creative Agent", "agents.creative", ("CreativeAgent",)),
+        ("AI Instructor Agent", "agents.instructor", ("AIInstructorAgent",)),
+    ]),
+    ("🖥️ Testing Interfaces...", [
+        ("API Interface", "interfaces.api", ("create_nova_api",)),
+        ("CLI Interface", "interfaces.cli", ("NOVACLIInterface",)),
+    ]),
+]
+IMPORT_CHECKS = [check for _, checks in IMPORT_SECTIONS for check in checks]
 
-try:
-    # Test Python version
-    print(f"✅ Python {sys.version}")
-    
-    # Test core imports
-    print("\n📦 Testing Core Imports...")
-    
-    try:
-        from core.brain import NOVABrain, NOVAConfig
-        print("✅ NOVA Brain - OK")
-    except Exception as e:
-        print(f"❌ NOVA Brain - FAILED: {e}")
-    
-    try:
-        from core.orchestrator import AgentOrchestrator, AgentType
-        print("✅ Agent Orchestrator - OK")
-    except Exception as e:
-        print(f"❌ Agent Orchestrator - FAILED: {e}")
-    
-    try:
-        from core.memory import MemorySystem
-        print("✅ Memory System - OK")
-    except Exception as e:
-        print(f"❌ Memory System - FAILED: {e}")
-    
-    try:
-        from core.personality import PersonalityEngine
-        print("✅ Personality Engine - OK")
-    except Exception as e:
-        print(f"❌ Personality Engine - FAILED: {e}")
-    
-    try:
-        from core.security import SecurityCore
-        print("✅ Security Core - OK")
-    except Exception as e:
-        print(f"❌ Security Core - FAILED: {e}")
-    
-    # Test agent imports
-    print("\n🤖 Testing Agent Imports...")
-    
-    try:
-        from agents.life_manager import LifeManagerAgent
-        print("✅ Life Manager Agent - OK")
-    except Exception as e:
-        print(f"❌ Life Manager Agent - FAILED: {e}")
-    
-    try:
-        from agents.finance import FinanceAgent
-        print("✅ Finance Agent - OK")
-    except Exception as e:
-        print(f"❌ Finance Agent - FAILED: {e}")
-    
-    try:
-        from agents.data_analyst import DataAnalystAgent
-        print("✅ Data Analyst Agent - OK")
-    except Exception as e:
-        print(f"❌ Data Analyst Agent - FAILED: {e}")
-    
-    try:
-        from agents.creative import CreativeAgent
-        print("✅ Creative Agent - OK")
-    except Exception as e:
-        print(f"❌ Creative Agent - FAILED: {e}")
-    
-    try:
-        from agents.instructor import AIInstructorAgent
-        print("✅ AI Instructor Agent - OK")
-    except Exception as e:
-        print(f"❌ AI Instructor Agent - FAILED: {e}")
-    
-    # Test interfaces
-    print("\n🖥️ Testing Interfaces...")
-    
-    try:
-        from interfaces.api import create_nova_api
-        print("✅ API Interface - OK")
-    except Exception as e:
-        print(f"❌ API Interface - FAILED: {e}")
-    
+QUICK = "--quick" in sys.argv[1:]
+
+
+def _find_module(check):
+    """Resolve a module without running it; returns the error, or None"""
     try:
-        from interfaces.cli import NOVACLIInterface
-        print("✅ CLI Interface - OK")
+        if importlib.util.find_spec(check[1]) is None:
+            return ModuleNotFoundError(f"No module named '{check[1]}'")
     except Exception as e:
-        print(f"❌ CLI Interface - FAILED: {e}")
-    
-    # Test configuration
-    print("\n⚙️ Testing Configuration...")
-    
+        return e
+    return None
+
+
+def _try_import(check):
+    """Import a module and look up its names; returns the error, or None"""
+    _, module, names = check
     try:
-        from config import config
-        print("✅ Configuration System - OK")
-        print(f"   📁 Config file: {config.config_path}")
-        print(f"   🏠 App name: {config.get('nova.name', 'NOVA')}")
+        imported = importlib.import_module(module)
+        for name in names:
+            getattr(imported, name)
     except Exception as e:
-        print(f"❌ Configuration System - FAILED: {e}")
-    
-    # Test file structure
-    print("\n📁 Verifying File Structure...")
-    
-    required_files = [
-        "main.py",
-        "launch.py", 
-        "config/config.yaml",
-        "config/__init__.py",
-        "install.sh",
-        "start.sh",
-        "install.bat",
-        "start.bat",
-        "requirements.txt",
-        "README.md"
-    ]
-    
-    for file_path in required_files:
-        if Path(file_path).exists():
-            print(f"✅ {file_path}")
-        else:
-            print(f"❌ {file_path} - MISSING")
-    
-    print("\n" + "=" * 50)
-    print("🎉 NOVA DEPLOYMENT VERIFICATION COMPLETE!")
-    print("\n📋 Summary:")
-    print("   • All core systems are properly imported")
-    print("   • All 8 specialized agents are available")
-    print("   • Configuration system is working")
-    print("   • Installation scripts are present")
-    print("   • File structure is complete")
-    print("\n✅ NOVA IS READY FOR DEPLOYMENT! 🚀")
-    print("\n🚀 Quick Start:")
-    print("   ./install.sh && ./start.sh")
-    print("   python main.py --god-mode 'hello NOVA'")
+        return e
+    return None
+
+
+def _import_all(checks):
+    """Run the import checks on a thread pool, so slow module initialization overlaps"""
+    # Missing modules are reported from their spec lookup; only the rest get imported
+    results = {check: _find_module(check) for check in checks}
+    if not QUICK:
+        present = [check for check in checks if results[check] is None]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results.update(zip(present, executor.map(_try_import, present)))
+    return [results[check] for check in checks]
+
+
+print("🚀 NOVA Deployment Verification")
+print("=" * 50)
+
+report = io.StringIO()
+
+try:
+    # The report is written out in one go once every check has run
+    with redirect_stdout(report):
+        # Test Python version
+        print(f"✅ Python {sys.version}")
+        
+        # Import every component at once and report per section once they are done
+        results = dict(zip(IMPORT_CHECKS, _import_all(IMPORT_CHECKS)))
+        
+        for section, checks in IMPORT_SECTIONS:
+            print(f"\n{section}")
+            for check in checks:
+                error = results[check]
+                if error is None:
+                    print(f"✅ {check[0]} - OK")
+                else:
+                    print(f"❌ {check[0]} - FAILED: {error}")
+        
+        # Test configuration
+        print("\n⚙️ Testing Configuration...")
+        
+        try:
+            from config import config
+            print("✅ Configuration System - OK")
+            print(f"   📁 Config file: {config.config_path}")
+            print(f"   🏠 App name: {config.get('nova.name', 'NOVA')}")
+        except Exception as e:
+            print(f"❌ Configuration System - FAILED: {e}")
+        
+        # Test file structure
+        print("\n📁 Verifying File Structure...")
+        
+        required_files = [
+            "main.py",
+            "launch.py", 
+            "config/config.yaml",
+            "config/__init__.py",
+            "install.sh",
+            "start.sh",
+            "install.bat",
+            "start.bat",
+            "requirements.txt",
+            "README.md"
+        ]
+        
+        for file_path in required_files:
+            if Path(file_path).exists():
+                print(f"✅ {file_path}")
+            else:
+                print(f"❌ {file_path} - MISSING")
+        
+        print("\n" + "=" * 50)
+        print("🎉 NOVA DEPLOYMENT VERIFICATION COMPLETE!")
+        print("\n📋 Summary:")
+        print("   • All core systems are properly imported")
+        print("   • All 8 specialized agents are available")
+        print("   • Configuration system is working")
+        print("   • Installation scripts are present")
+        print("   • File structure is complete")
+        print("\n✅ NOVA IS READY FOR DEPLOYMENT! 🚀")
+        print("\n🚀 Quick Start:")
+        print("   ./install.sh && ./start.sh")
+        print("   python main.py --god-mode 'hello NOVA'")
 
 except Exception as e:
+    sys.stdout.write(report.getvalue())
     print(f"\n❌ CRITICAL ERROR: {e}")
     print("\n🔍 Stack trace:")
     traceback.print_exc()
     sys.exit(1)
+else:
+    sys.stdout.write(report.getvalue())